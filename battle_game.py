@@ -1,36 +1,101 @@
+from collections import deque
+
 import numpy as np
 import pygame
 import tkinter as tk
 from tkinter import scrolledtext
 
+# True にすると盤面・マスクの途中経過をコンソールに出力する
+DEBUG = False
+
+# 3x3 マスクはセル (i, j) をビット i*3+j に対応させた 9 ビット整数でも保持する
+_BIT_WEIGHTS = 1 << np.arange(9)
+# ビットマップ -> 3x3 の bool マスク（512 通りを事前計算）
+_BIT_CELLS = ((np.arange(512)[:, None] >> np.arange(9)) & 1).astype(bool).reshape(512, 3, 3)
+# 各列 j のセルに対応するビット
+_COLUMN_BITS = (0b001001001, 0b010010010, 0b100100100)
+# Zobrist ハッシュ用の乱数表: [マスの平坦インデックス][マスの値]。値 0（空き）は 0 にしておく
+_ZOBRIST = np.random.default_rng(0x5EED).integers(1, 2**63, size=(81, 5), dtype=np.uint64)
+_ZOBRIST[:, 0] = 0
+_ZOBRIST = _ZOBRIST.tolist()
+# プレイヤー 2 の手番のときに XOR するキー
+_ZOBRIST_SIDE = int(np.random.default_rng(0x51DE).integers(1, 2**63, dtype=np.uint64))
+# 上下左右の移動方向（W/S/A/D キーと同じ順）
+DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+# legal_moves のキャッシュ上限（超えたら丸ごと捨てる）
+LEGAL_MOVES_CACHE_SIZE = 4096
+# ログウィンドウ (Tk) のイベント処理を回すタイマーイベント
+LOG_WINDOW_TICK = pygame.USEREVENT + 1
+LOG_WINDOW_TICK_MS = 100
+
+def mask_to_bits(mask):
+    """Pack the non-zero cells of a 3x3 mask into a 9-bit integer"""
+    return int((mask.ravel() != 0) @ _BIT_WEIGHTS)
+
+def align_bits(bits, dx, dy):
+    """Re-express a block bitmap in the frame of a block offset by (-dx, -dy), dropping cells that fall outside"""
+    if not (-3 < dx < 3 and -3 < dy < 3):
+        return 0
+    # 列方向にはみ出すセルは、シフトで隣の行に回り込む前に落としておく
+    for j in range(3):
+        if not 0 <= j + dy < 3:
+            bits &= ~_COLUMN_BITS[j]
+    shift = dx * 3 + dy
+    bits = bits << shift if shift >= 0 else bits >> -shift
+    return bits & 0x1FF
+
 class BattleGame:
     def __init__(self):
-        print("Initializing game...")
+        self.debug = DEBUG
+        if self.debug:
+            print("Initializing game...")
         self.board_size = 9
         self.cell_size = 60
         self.log_area_height = 150
         self.window_width = self.board_size * self.cell_size
         self.window_height = self.board_size * self.cell_size + self.log_area_height
-        self.board = np.zeros((self.board_size, self.board_size), dtype=int)
+        # 盤面は x * board_size + y で引く平坦な bytearray（1マス1バイト）
+        self.board = bytearray(self.board_size * self.board_size)
+        # 3x3 ブロック単位の操作用に、同じメモリを共有する 2 次元ビュー
+        self.board_view = np.frombuffer(self.board, dtype=np.int8).reshape(self.board_size, self.board_size)
         self.players = [
-            {'soldiers': (1, 1), 'king': (0, 0), 'symbol': 1, 'king_symbol': 3, 'mask': np.ones((3, 3), dtype=int)},
-            {'soldiers': (5, 5), 'king': (8, 8), 'symbol': 2, 'king_symbol': 4, 'mask': np.ones((3, 3), dtype=int)* 2}
+            {'soldiers': (1, 1), 'king': (0, 0), 'symbol': 1, 'king_symbol': 3, 'mask': np.ones((3, 3), dtype=np.int8)},
+            {'soldiers': (5, 5), 'king': (8, 8), 'symbol': 2, 'king_symbol': 4, 'mask': np.ones((3, 3), dtype=np.int8) * 2}
         ]
-        print("Player 1 initial mask:")
-        print(self.players[0]['mask'])
-        print("Player 2 initial mask:")
-        print(self.players[1]['mask'])
+        if self.debug:
+            print("Player 1 initial mask:")
+            print(self.players[0]['mask'])
+            print("Player 2 initial mask:")
+            print(self.players[1]['mask'])
         self.hidden_king = {1: self.players[0]['king'], 2: self.players[1]['king']}
+        # 手番ごとの敵側の記号とインデックス（移動のたびに分岐しないよう事前に用意）
+        self.roles = {
+            1: {'enemy': (2, 4), 'enemy_symbol': 2, 'enemy_king_symbol': 4, 'enemy_index': 1},
+            2: {'enemy': (1, 3), 'enemy_symbol': 1, 'enemy_king_symbol': 3, 'enemy_index': 0},
+        }
+        # マスの値 -> 持ち主のプレイヤー番号 / 王かどうか（クリック判定用）
+        self.owner_of = {0: 0, 1: 1, 2: 2, 3: 1, 4: 2}
+        self.is_king = {0: False, 1: False, 2: False, 3: True, 4: True}
         self.place_pieces()
-        print("Game initialized successfully.")
+        if self.debug:
+            print("Game initialized successfully.")
         pygame.init()
         self.font = pygame.font.SysFont(None, 24)
         self.screen = pygame.display.set_mode((self.window_width, self.window_height))
+        self.setup_render_cache()
         self.selected_piece = None
         self.current_player = 1
         self.selected_is_king = False
+        # 盤面と手番の Zobrist ハッシュ（以降は移動のたびに差分更新する）
+        self.zobrist_hash = self.state_hash()
+        # (zobrist_hash, 自軍兵士ブロックの位置) -> 合法手
+        self.legal_moves_cache = {}
+        # 盤面やログに変化があったときだけ再描画するためのフラグ
+        self.dirty = True
         # ログ用の変数と Tkinter のログウィンドウを作成
-        self.log_messages = []
+        self.log_messages = deque(maxlen=10)
+        # メッセージ文字列 -> 描画済み Surface（表示中のログ分だけ保持）
+        self.log_surfaces = {}
         self.setup_log_window()
 
     def setup_log_window(self):
@@ -56,224 +121,300 @@ class BattleGame:
             print(f"Warning: Could not create log window: {e}")
             self.log_window = None
     
+    def update_log_window(self):
+        """Process pending Tk events for the log window"""
+        if not self.log_window:
+            return
+        try:
+            self.log_window.update()
+        except tk.TclError:
+            # ログウィンドウが閉じられた後はタイマーも止める
+            self.log_window = None
+            self.log_display = None
+            pygame.time.set_timer(LOG_WINDOW_TICK, 0)
+
+    def setup_render_cache(self):
+        """Pre-render the static grid and piece sprites used by draw_board"""
+        cs = self.cell_size
+        # マスごとの Rect は盤面と同じ平坦なインデックスで引く
+        self.cell_rects = [
+            pygame.Rect(y * cs, x * cs, cs, cs)
+            for x, y in (divmod(idx, self.board_size) for idx in range(self.board_size * self.board_size))
+        ]
+        # 白地とグリッド線は毎フレーム変わらないので一度だけ描いておく
+        self.bg_surface = pygame.Surface((self.window_width, self.window_height))
+        self.bg_surface.fill((255, 255, 255))
+        for rect in self.cell_rects:
+            pygame.draw.rect(self.bg_surface, (200, 200, 200), rect, 1)
+
+        def soldier_sprite(color):
+            sprite = pygame.Surface((cs, cs), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (cs // 2, cs // 2), cs // 3)
+            return sprite
+
+        king_sprite = pygame.Surface((cs, cs))
+        king_sprite.fill((0, 255, 0))
+        # 王は相手から区別できないよう両プレイヤーで同じ見た目
+        self.piece_sprites = {
+            1: soldier_sprite((0, 0, 255)),
+            2: soldier_sprite((255, 0, 0)),
+            3: king_sprite,
+            4: king_sprite,
+        }
+
+    def cell(self, x, y):
+        return self.board[x * self.board_size + y]
+
+    def state_hash(self):
+        """Compute the Zobrist hash of the board and side to move from scratch"""
+        h = _ZOBRIST_SIDE if self.current_player == 2 else 0
+        for keys, value in zip(_ZOBRIST, self.board):
+            h ^= keys[value]
+        return h
+
+    def zobrist_region(self, x0, y0, x1, y1):
+        """XOR of the Zobrist keys for the cells in rows x0..x1-1, columns y0..y1-1"""
+        board = self.board
+        h = 0
+        for x in range(x0, x1):
+            base = x * self.board_size
+            for idx in range(base + y0, base + y1):
+                h ^= _ZOBRIST[idx][board[idx]]
+        return h
+
+    def legal_moves(self):
+        """Return the (is_king, direction) moves available to the side to move"""
+        key = (self.zobrist_hash, self.players[self.current_player - 1]['soldiers'])
+        moves = self.legal_moves_cache.get(key)
+        if moves is None:
+            if len(self.legal_moves_cache) >= LEGAL_MOVES_CACHE_SIZE:
+                self.legal_moves_cache.clear()
+            moves = self.legal_moves_cache[key] = self.generate_legal_moves()
+        return moves
+
+    def generate_legal_moves(self):
+        n = self.board_size
+        player = self.players[self.current_player - 1]
+        enemy = self.roles[self.current_player]['enemy']
+        moves = []
+        kx, ky = self.hidden_king[self.current_player]
+        for dx, dy in DIRECTIONS:
+            x, y = kx + dx, ky + dy
+            if 0 <= x < n and 0 <= y < n and (self.board[x * n + y] == 0 or self.board[x * n + y] in enemy):
+                moves.append((True, (dx, dy)))
+        # 兵士が全滅していればブロックは選択できない
+        if player['mask_bits']:
+            sx, sy = player['soldiers']
+            for dx, dy in DIRECTIONS:
+                if 0 <= sx + dx <= n - 3 and 0 <= sy + dy <= n - 3:
+                    moves.append((False, (dx, dy)))
+        return tuple(moves)
+
     #ログ表示用の関数
     def log(self, message):
-        print(message)
+        if self.debug:
+            print(message)
+        self.dirty = True
+        # maxlen に達していれば append で先頭が押し出される
+        evicted = self.log_messages[0] if len(self.log_messages) == self.log_messages.maxlen else None
         self.log_messages.append(message)
-        if len(self.log_messages) > 10:
-            self.log_messages.pop(0)
+        if evicted is not None and evicted not in self.log_messages:
+            self.log_surfaces.pop(evicted, None)
         
         # Update log window if it exists
         if hasattr(self, 'log_display') and self.log_display:
             try:
                 self.log_display.insert(tk.END, message + "\n")
                 self.log_display.see(tk.END)
+                # 入力イベントの処理はタイマーに任せ、ここでは再描画だけ反映する
+                self.log_window.update_idletasks()
             except:
                 pass
     def place_pieces(self):
-        print("Placing pieces on the board...")
+        if self.debug:
+            print("Placing pieces on the board...")
         for player in self.players:
             sx, sy = player['soldiers']
-            self.board[sx:sx+3, sy:sy+3] = player['mask']
+            self.board_view[sx:sx+3, sy:sy+3] = player['mask']
+            player['mask_bits'] = mask_to_bits(player['mask'])
             kx, ky = player['king']
-            self.board[kx, ky] = player['king_symbol']
-        print("Pieces placed successfully.")
+            self.board[kx * self.board_size + ky] = player['king_symbol']
+        if self.debug:
+            print("Pieces placed successfully.")
 
     def draw_board(self):
-        self.screen.fill((255, 255, 255))
-        for x in range(self.board_size):
-            for y in range(self.board_size):
-                rect = pygame.Rect(y * self.cell_size, x * self.cell_size, self.cell_size, self.cell_size)
-                pygame.draw.rect(self.screen, (200, 200, 200), rect, 1)
-                if self.board[x, y] == 1:
-                    pygame.draw.circle(self.screen, (0, 0, 255), rect.center, self.cell_size // 3)
-                elif self.board[x, y] == 2:
-                    pygame.draw.circle(self.screen, (255, 0, 0), rect.center, self.cell_size // 3)
-                elif self.board[x, y] in [3, 4]:
-                    pygame.draw.rect(self.screen, (0, 255, 0), rect)
+        # ループ内で何度も引く属性はローカル変数に束縛しておく
+        screen = self.screen
+        blit = screen.blit
+        draw_line = pygame.draw.line
+        sprites = self.piece_sprites
+        cell_rects = self.cell_rects
+        cs = self.cell_size
+        blit(self.bg_surface, (0, 0))
+        for idx, value in enumerate(self.board):
+            if value:
+                blit(sprites[value], cell_rects[idx])
         if self.selected_piece is not None:
             if self.selected_is_king:
-                rect = pygame.Rect(self.selected_piece[1] * self.cell_size,
-                                self.selected_piece[0] * self.cell_size,
-                                self.cell_size, self.cell_size)
-                pygame.draw.rect(self.screen, (255, 255, 0), rect, 3)
+                rect = cell_rects[self.selected_piece[0] * self.board_size + self.selected_piece[1]]
+                pygame.draw.rect(screen, (255, 255, 0), rect, 3)
             else:
                 # 兵士グループの場合：soldier_pos は兵士ブロックの左上座標
                 soldier_pos = self.players[self.current_player - 1]['soldiers']
                 mask = self.players[self.current_player - 1]['mask']
                 # 盤面上の左上のピクセル座標を計算
-                top = soldier_pos[0] * self.cell_size
-                left = soldier_pos[1] * self.cell_size
-                # mask の各セルについて、隣接セルが無効な部分に境界線を描画
-                for i in range(3):
-                    for j in range(3):
-                        if mask[i, j] != 0:
-                            cell_left = left + j * self.cell_size
-                            cell_top = top + i * self.cell_size
-                            # 左辺
-                            if j == 0 or mask[i, j-1] == 0:
-                                pygame.draw.line(self.screen, (255, 255, 0),
-                                                (cell_left, cell_top),
-                                                (cell_left, cell_top + self.cell_size), 3)
-                            # 右辺
-                            if j == 2 or mask[i, j+1] == 0:
-                                pygame.draw.line(self.screen, (255, 255, 0),
-                                                (cell_left + self.cell_size, cell_top),
-                                                (cell_left + self.cell_size, cell_top + self.cell_size), 3)
-                            # 上辺
-                            if i == 0 or mask[i-1, j] == 0:
-                                pygame.draw.line(self.screen, (255, 255, 0),
-                                                (cell_left, cell_top),
-                                                (cell_left + self.cell_size, cell_top), 3)
-                            # 下辺
-                            if i == 2 or mask[i+1, j] == 0:
-                                pygame.draw.line(self.screen, (255, 255, 0),
-                                                (cell_left, cell_top + self.cell_size),
-                                                (cell_left + self.cell_size, cell_top + self.cell_size), 3)
+                top = soldier_pos[0] * cs
+                left = soldier_pos[1] * cs
+                # mask の有効セルのうち、隣接セルが無効（盤外を含む）な辺を配列のずらしで一括判定
+                filled = mask != 0
+                padded = np.pad(filled, 1)
+                # (辺の有無, 線の始点・終点をセル単位で表したオフセット)
+                edge_sets = (
+                    (filled & ~padded[1:-1, :-2], (0, 0, 0, 1)),  # 左辺
+                    (filled & ~padded[1:-1, 2:], (1, 0, 1, 1)),   # 右辺
+                    (filled & ~padded[:-2, 1:-1], (0, 0, 1, 0)),  # 上辺
+                    (filled & ~padded[2:, 1:-1], (0, 1, 1, 1)),   # 下辺
+                )
+                for edges, (x0, y0, x1, y1) in edge_sets:
+                    for i, j in np.argwhere(edges).tolist():
+                        cell_left = left + j * cs
+                        cell_top = top + i * cs
+                        draw_line(screen, (255, 255, 0),
+                                  (cell_left + x0 * cs, cell_top + y0 * cs),
+                                  (cell_left + x1 * cs, cell_top + y1 * cs), 3)
         # ログを画面下部に描画
         self.draw_logs()
         pygame.display.flip()
+        self.dirty = False
 
     def draw_logs(self):
         # ログを右下に表示する例
-        y_offset = self.window_size - 20 * len(self.log_messages)
+        blit = self.screen.blit
+        render = self.font.render
+        surfaces = self.log_surfaces
+        y_offset = self.window_height - 20 * len(self.log_messages)
         for msg in self.log_messages:
-            text_surf = self.font.render(msg, True, (0, 0, 0))
-            self.screen.blit(text_surf, (5, y_offset))
+            # 同じ文字列は一度だけレンダリングし、以降は Surface を使い回す
+            text_surf = surfaces.get(msg)
+            if text_surf is None:
+                text_surf = render(msg, True, (0, 0, 0))
+                surfaces[msg] = text_surf
+            blit(text_surf, (5, y_offset))
             y_offset += 20
     # 駒をクリックしたときのログ更新
     def handle_click(self, pos):
+        self.dirty = True
         x, y = pos[1] // self.cell_size, pos[0] // self.cell_size
-        if self.board[x, y] in [1, 3] and self.current_player == 1:
-            if self.board[x, y] == 1:
-                self.selected_piece = self.players[0]['soldiers']
-                self.selected_is_king = False
-                self.log(f"Selected soldier group for player 1 at {self.selected_piece}.")
-            else:
-                self.selected_piece = (x, y)
-                self.selected_is_king = True
-                self.log(f"Selected king for player 1 at ({x}, {y}).")
-        elif self.board[x, y] in [2, 4] and self.current_player == 2:
-            if self.board[x, y] == 2:
-                self.selected_piece = self.players[1]['soldiers']
-                self.selected_is_king = False
-                self.log(f"Selected soldier group for player 2 at {self.selected_piece}.")
-            else:
-                self.selected_piece = (x, y)
-                self.selected_is_king = True
-                self.log(f"Selected king for player 2 at ({x}, {y}).")
-        else:
+        cell = self.cell(x, y)
+        if self.owner_of[cell] != self.current_player:
             self.log(f"Invalid selection at cell ({x}, {y}). Not your movable piece.")
+            return
+        if self.is_king[cell]:
+            self.selected_piece = (x, y)
+            self.selected_is_king = True
+            self.log(f"Selected king for player {self.current_player} at ({x}, {y}).")
+        else:
+            self.selected_piece = self.players[self.current_player - 1]['soldiers']
+            self.selected_is_king = False
+            self.log(f"Selected soldier group for player {self.current_player} at {self.selected_piece}.")
 
     def update_soldier_mask(self, mask, dest_area, enemy, player_symbol):
         new_mask = mask.copy()
-        for i in range(mask.shape[0]):
-            for j in range(mask.shape[1]):
-                if mask[i, j] == player_symbol and dest_area[i, j] in enemy:
-                    new_mask[i, j] = 0
+        # enemy は常に2要素なので np.isin より直接比較の方が軽い
+        new_mask[(mask == player_symbol) & ((dest_area == enemy[0]) | (dest_area == enemy[1]))] = 0
         return new_mask
 
     def move_selected_piece(self, direction):
         if not self.selected_piece:
             return
+        self.dirty = True
         dx, dy = direction
+        role = self.roles[self.current_player]
         if self.selected_is_king:
             x, y = self.selected_piece
             new_x, new_y = x + dx, y + dy
             if not (0 <= new_x < self.board_size and 0 <= new_y < self.board_size):
                 self.log("Invalid move: Out of bounds.")
                 return
-            if self.board[new_x, new_y] in [0, 2, 4]:
-                if self.board[new_x, new_y] == 4:
+            src = x * self.board_size + y
+            dst = new_x * self.board_size + new_y
+            if self.board[dst] == 0 or self.board[dst] in role['enemy']:
+                if self.board[dst] == role['enemy_king_symbol']:
                     self.log(f"Player {self.current_player} wins! Game over.")
                     pygame.quit()
                     exit()
-                self.board[new_x, new_y] = self.board[x, y]
-                self.board[x, y] = 0
+                self.zobrist_hash ^= _ZOBRIST[src][self.board[src]] ^ _ZOBRIST[dst][self.board[dst]]
+                self.board[dst] = self.board[src]
+                self.board[src] = 0
+                self.zobrist_hash ^= _ZOBRIST[dst][self.board[dst]]
                 self.hidden_king[self.current_player] = (new_x, new_y)
             else:
                 self.log("Invalid move: Space occupied by friendly unit.")
                 return
         else:
             orig = self.players[self.current_player - 1]['soldiers']
-            print(f"Player {self.current_player} original soldier position: {orig}")  # デバッグ出力
             mask = self.players[self.current_player - 1]['mask']
-            print(f"Player {self.current_player} mask: {mask}")
+            if self.debug:
+                print(f"Player {self.current_player} original soldier position: {orig}")
+                print(f"Player {self.current_player} mask: {mask}")
             new_x, new_y = orig[0] + dx, orig[1] + dy
             if not (0 <= new_x <= self.board_size - 3 and 0 <= new_y <= self.board_size - 3):
                 self.log("Invalid move: Out of bounds.")
                 return
-            # コピーした移動先の領域
-            dest_area = self.board[new_x:new_x+3, new_y:new_y+3].copy()
-            print(f"Player {self.current_player} dest area:")
-            print(dest_area)
-            enemy = [2, 4] if self.current_player == 1 else [1, 3]
-
+            # 移動先の領域（ビュー）。盤面への書き込みは new_area を作った後なのでコピー不要
+            dest_area = self.board_view[new_x:new_x+3, new_y:new_y+3]
+            if self.debug:
+                print(f"Player {self.current_player} dest area:")
+                print(dest_area)
             # 現在のプレイヤーに応じた敵番号と敵のデータを取得
-            if self.current_player == 1:
-                enemy_symbol = 2
-                enemy_king_symbol = 4
-                enemy_index = 1
-            else:
-                enemy_symbol = 1
-                enemy_king_symbol = 3
-                enemy_index = 0
+            enemy = role['enemy']
+            enemy_index = role['enemy_index']
             # 敵兵士ブロックの情報
-            enemy_orig = self.players[enemy_index]['soldiers']
-            print(f"Player {self.current_player} enemy soldier position: {enemy_orig}")
-            enemy_mask = self.players[enemy_index]['mask'].copy()
-            print(f"Player {self.current_player} enemy soldier mask: {enemy_mask}")
+            enemy_player = self.players[enemy_index]
+            enemy_orig = enemy_player['soldiers']
+            if self.debug:
+                print(f"Player {self.current_player} enemy soldier position: {enemy_orig}")
+                print(f"Player {self.current_player} enemy soldier mask: {enemy_player['mask']}")
             # 移動先ブロック内で、もし敵兵士ブロックと重なる領域があれば、敵マスクを更新（重なった箇所を0にする）
-            # まず、重なり領域の範囲を計算
-            overlap_top = max(new_x, enemy_orig[0])
-            overlap_left = max(new_y, enemy_orig[1])
-            overlap_bottom = min(new_x+3, enemy_orig[0]+3)
-            overlap_right = min(new_y+3, enemy_orig[1]+3)
-            
-            captured_positions = []  # 捕獲したマスのリスト
-            if overlap_bottom > overlap_top and overlap_right > overlap_left:
-                for i in range(overlap_top, overlap_bottom):
-                    for j in range(overlap_left, overlap_right):
-                        # 重なりセルの相対座標（敵側）
-                        rel_i = i - enemy_orig[0]
-                        rel_j = j - enemy_orig[1]
-                        # もし移動する兵士側のマスクが有効なら、敵のそのセルを捕獲（0にする）
-                        if mask[i-new_x, j-new_y] != 0 and enemy_mask[rel_i, rel_j] != 0:
-                            print(f"Captured enemy soldier at enemy_mask[{rel_i}][{rel_j}] (Board Position: {i}, {j})")
-                            enemy_mask[rel_i, rel_j] = 0
-                            captured_positions.append((rel_i, rel_j, i, j))
-                # 捕獲したマスを表示
-                if captured_positions:
+            # 自軍ビットマップを敵ブロック基準にずらし、AND で捕獲セルを求める
+            mask_bits = self.players[self.current_player - 1]['mask_bits']
+            captured = align_bits(mask_bits, new_x - enemy_orig[0], new_y - enemy_orig[1]) & enemy_player['mask_bits']
+            if captured:
+                enemy_player['mask_bits'] &= ~captured
+                # ndarray 側のマスクは描画用に同期しておく
+                enemy_mask = enemy_player['mask'].copy()
+                enemy_mask[_BIT_CELLS[captured]] = 0
+                enemy_player['mask'] = enemy_mask
+                if self.debug:
+                    # 捕獲したマスを表示
                     print("Captured Positions:")
-                    for rel_i, rel_j, i, j in captured_positions:
-                        print(f"  enemy_mask[{rel_i}][{rel_j}] -> 0 (Board Position: {i}, {j})")
-                   # 更新後の敵マスクを表示
-                print("Updated Enemy Mask:")
-                for row in enemy_mask:
-                    print("  " + " ".join(map(str, row)))
-            # 更新した敵マスクを保存
-            self.players[enemy_index]['mask'] = enemy_mask
-            # new_area を、dest_area の中から敵の番号だけを保持し、その他は 0 にする
-            new_area = np.where(np.isin(dest_area, enemy), dest_area, 0)
-            for i in range(3):
-                for j in range(3):
-                    if mask[i, j] != 0:
-                        new_area[i, j] = self.current_player
-                        
-            print(f"Player {self.current_player} new area: {new_area}")
+                    for rel_i, rel_j in np.argwhere(_BIT_CELLS[captured]).tolist():
+                        print(f"  enemy_mask[{rel_i}][{rel_j}] -> 0 (Board Position: {enemy_orig[0] + rel_i}, {enemy_orig[1] + rel_j})")
+                    # 更新後の敵マスクを表示
+                    print("Updated Enemy Mask:")
+                    for row in enemy_mask:
+                        print("  " + " ".join(map(str, row)))
+            # new_area を、dest_area の中から敵の番号だけを保持し、mask が有効なセルには自軍を置く
+            occupied = _BIT_CELLS[mask_bits]
+            new_area = np.where((dest_area == enemy[0]) | (dest_area == enemy[1]), dest_area, 0)
+            new_area[occupied] = self.current_player
+            if self.debug:
+                print(f"Player {self.current_player} new area: {new_area}")
+            # 移動元と移動先を囲む領域のハッシュを書き換え前後で差し替える
+            region = (min(orig[0], new_x), min(orig[1], new_y), max(orig[0], new_x) + 3, max(orig[1], new_y) + 3)
+            self.zobrist_hash ^= self.zobrist_region(*region)
             # 元の移動元ブロックのうち、mask が有効なセルのみ 0 にする
-            for i in range(3):
-                for j in range(3):
-                    if mask[i, j] != 0:
-                        self.board[orig[0] + i, orig[1] + j] = 0
+            self.board_view[orig[0]:orig[0]+3, orig[1]:orig[1]+3][occupied] = 0
 
             # 移動先ブロックを更新
-            self.board[new_x:new_x+3, new_y:new_y+3] = new_area
+            self.board_view[new_x:new_x+3, new_y:new_y+3] = new_area
+            self.zobrist_hash ^= self.zobrist_region(*region)
             # 更新後、移動側の兵士データはマスクそのまま、移動先座標のみ更新
             self.players[self.current_player - 1]['soldiers'] = (new_x, new_y)
         self.selected_piece = None
         self.log(f"Player {self.current_player} moved soldiers to ({new_x}, {new_y})")
         self.current_player = 2 if self.current_player == 1 else 1
+        self.zobrist_hash ^= _ZOBRIST_SIDE
         self.log(f"Next turn: Player {self.current_player}")
 
     def game_loop(self):
@@ -283,19 +424,22 @@ class BattleGame:
             
         pygame.display.set_caption("Battle Game")
         running = True
+        clock = pygame.time.Clock()
+        # Tk の update() は毎フレームではなく一定間隔のタイマーで呼ぶ
+        if self.log_window:
+            pygame.time.set_timer(LOG_WINDOW_TICK, LOG_WINDOW_TICK_MS)
         while running:
-            self.draw_board()
-            
-            # Update log window if it exists
-            if self.log_window:
-                try:
-                    self.log_window.update()
-                except:
-                    pass
-                    
-            for event in pygame.event.get():
+            if self.dirty:
+                self.draw_board()
+
+            # 入力があるまでブロックし、溜まっているイベントはまとめて処理する
+            for event in [pygame.event.wait()] + pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
+                elif event.type == pygame.VIDEOEXPOSE:
+                    self.dirty = True
+                elif event.type == LOG_WINDOW_TICK:
+                    self.update_log_window()
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     self.handle_click(event.pos)
                 elif event.type == pygame.KEYDOWN:
@@ -307,7 +451,10 @@ class BattleGame:
                         self.move_selected_piece((0, -1))
                     elif event.key == pygame.K_d:
                         self.move_selected_piece((0, 1))
+            # 連続入力時も描画は 60 FPS を上限にする
+            clock.tick(60)
         
+        pygame.time.set_timer(LOG_WINDOW_TICK, 0)
         pygame.quit()
         if self.log_window:
             try:
@@ -10,37 +10,109 @@ the script can still be executed for automated smoke tests or demonstrations.
 from __future__ import annotations
 
 import argparse
+import multiprocessing
 import os
 import sys
-import threading
+from multiprocessing.process import BaseProcess
 from typing import Optional
 
-if not os.environ.get("DISPLAY") and sys.platform != "win32":
-    # In CI or other headless environments pygame cannot open a window.  The
-    # dummy driver allows pygame to initialise without a display so we can run
-    # non-interactive smoke tests.
-    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
-    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+# The GUI toolkits (Tk, pygame via the game modules) are imported on first use
+# so that the headless path never pays for loading them.
+tk = None
+messagebox = None
+PokerResearchGUI = None
 
-import pygame
-import tkinter as tk
-from tkinter import messagebox
+# Child processes are spawned, not forked: a fork would inherit this process's
+# Tk interpreter and X connection, which the child must not share.
+_SPAWN = multiprocessing.get_context("spawn")
+
+
+def _load_gui() -> None:
+    """Import the Tk-based modules used by the main menu."""
+
+    global tk, messagebox, PokerResearchGUI
+    if tk is not None:
+        return
+    import tkinter as tk
+    from tkinter import messagebox
+    from poker_research_gui import PokerResearchGUI
+
+
+def _use_dummy_sdl_drivers() -> None:
+    """Let pygame initialise without a display (must run before importing it)."""
+
+    if not os.environ.get("DISPLAY") and sys.platform != "win32":
+        # In CI or other headless environments pygame cannot open a window.  The
+        # dummy driver allows pygame to initialise without a display so we can run
+        # non-interactive smoke tests.
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+# Static text for the "About" panel of the main menu
+_INFO_CONTENT = """\
+Battle Game: A strategic board game with hidden information elements.
+Move soldiers and kings on a 9x9 grid to defeat your opponent.
+
+Poker Research Tool: Advanced GTO (Game Theory Optimal) poker analysis.
+Analyze hand ranges, calculate equity, study tournament spots, and run simulations.
+
+This integrated platform allows you to research strategic thinking across
+different game types and improve your decision-making skills."""
+
+
+def _run_battle_game(ready=None, errors=None) -> None:
+    """Child-process entry point for the battle game.
+
+    ``ready`` is set once the game window has been created, just before the
+    game loop starts.  If the game raises, its message is sent on ``errors``
+    (the write end of a pipe) so the menu can report it.
+    """
+
+    _use_dummy_sdl_drivers()
+
+    try:
+        from battle_game import BattleGame
+
+        game = BattleGame()
+        if ready is not None:
+            ready.set()
+        game.game_loop()
+    except Exception as exc:
+        print(f"Failed to start Battle Game: {exc}")
+        if errors is not None:
+            errors.send(str(exc))
+        raise
 
-from battle_game import BattleGame
-from poker_research_gui import PokerResearchGUI
 
 class IntegratedStrategyGame:
     """
     Main application that integrates the battle game with poker research tools
     """
     
+    # How often the menu checks whether a child application has exited
+    PROCESS_POLL_MS = 500
+    # How often "Launch Both" checks whether the battle game has finished starting
+    READY_POLL_MS = 20
+    # How long the non-modal launch notices stay on screen
+    TOAST_MS = 2500
+
     def __init__(self):
-        self.battle_game = None
-        self.poker_gui = None
+        # pygame needs its own main thread, so the battle game runs in a
+        # separate process; the poker tool is a Toplevel on this mainloop.
+        _load_gui()
+        self._battle_proc: Optional[BaseProcess] = None
+        self.poker_gui: Optional[PokerResearchGUI] = None
+        self._battle_ready = _SPAWN.Event()
         self.setup_main_menu()
     
     def setup_main_menu(self):
         """Create the main menu interface"""
+        if getattr(self, '_built', False):
+            # Already built: re-entering the menu only needs a redraw
+            self.root.deiconify()
+            return
+
         self.root = tk.Tk()
         self.root.title("Strategy Game Hub - Battle Game & Poker Research")
         self.root.geometry("600x400")
@@ -137,20 +209,9 @@ class IntegratedStrategyGame:
             wrap='word'
         )
         info_text.pack(padx=10, pady=10)
-        
-        info_content = """
-Battle Game: A strategic board game with hidden information elements.
-Move soldiers and kings on a 9x9 grid to defeat your opponent.
-
-Poker Research Tool: Advanced GTO (Game Theory Optimal) poker analysis.
-Analyze hand ranges, calculate equity, study tournament spots, and run simulations.
-
-This integrated platform allows you to research strategic thinking across
-different game types and improve your decision-making skills.
-        """.strip()
-        
-        info_text.insert('1.0', info_content)
+        info_text.insert('1.0', _INFO_CONTENT)
         info_text.config(state='disabled')
+        self._info_widget = info_text
         
         # Status bar
         self.status_var = tk.StringVar()
@@ -164,24 +225,56 @@ different game types and improve your decision-making skills.
             fg='white'
         )
         status_bar.pack(side=tk.BOTTOM, fill=tk.X)
+        self._built = True
     
+    def _watch_battle_game(self, proc: BaseProcess, errors) -> None:
+        """Report the battle game's exit, showing an error if it failed"""
+        if proc.is_alive():
+            self.root.after(self.PROCESS_POLL_MS, self._watch_battle_game, proc, errors)
+            return
+        proc.join()
+        if proc.exitcode:
+            detail = errors.recv() if errors.poll() else f"exit code {proc.exitcode}"
+            messagebox.showerror("Error", f"Failed to start Battle Game: {detail}")
+        errors.close()
+        self.status_var.set("Battle Game closed")
+
+    def _toast(self, title: str, message: str) -> None:
+        """Show a non-modal notice that closes itself after TOAST_MS"""
+        top = tk.Toplevel(self.root)
+        top.title(title)
+        top.transient(self.root)
+        tk.Label(top, text=message, justify=tk.LEFT, padx=20, pady=15).pack()
+        top.after(self.TOAST_MS, top.destroy)
+
+    @staticmethod
+    def _stop_process(proc: Optional[BaseProcess]) -> None:
+        if proc is not None and proc.is_alive():
+            proc.terminate()
+            proc.join(timeout=2)
+
     def start_battle_game(self):
-        """Start the battle game in a separate thread"""
-        def run_battle_game():
-            try:
-                self.status_var.set("Starting Battle Game...")
-                self.battle_game = BattleGame()
-                self.battle_game.game_loop()
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to start Battle Game: {str(e)}")
-            finally:
-                self.status_var.set("Battle Game closed")
-        
-        # Run in separate thread to avoid blocking the main GUI
-        game_thread = threading.Thread(target=run_battle_game, daemon=True)
-        game_thread.start()
+        """Start the battle game in a separate process"""
+        if self._battle_proc is not None and self._battle_proc.is_alive():
+            self.status_var.set("Battle Game is already running")
+            return
+
+        try:
+            self.status_var.set("Starting Battle Game...")
+            self._battle_ready = _SPAWN.Event()
+            errors, child_errors = _SPAWN.Pipe(duplex=False)
+            self._battle_proc = _SPAWN.Process(
+                target=_run_battle_game, args=(self._battle_ready, child_errors), daemon=False
+            )
+            self._battle_proc.start()
+            child_errors.close()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to start Battle Game: {str(e)}")
+            self.status_var.set("Ready")
+            return
+        self._watch_battle_game(self._battle_proc, errors)
         
-        messagebox.showinfo(
+        self._toast(
             "Battle Game", 
             "Battle Game is starting!\n\n"
             "Controls:\n"
@@ -193,26 +286,15 @@ different game types and improve your decision-making skills.
     def start_poker_research(self):
         """Start the poker research tool"""
         try:
-            self.status_var.set("Starting Poker Research Tool...")
-            
             if self.poker_gui:
                 # If already running, just bring to front
                 self.poker_gui.root.lift()
                 self.poker_gui.root.focus_force()
             else:
-                # Create new poker GUI instance
-                self.poker_gui = PokerResearchGUI()
-                
-                # Override the mainloop to integrate with our main application
-                def run_poker_gui():
-                    self.poker_gui.run()
-                    self.poker_gui = None  # Reset when closed
-                    self.status_var.set("Poker Research Tool closed")
-                
-                poker_thread = threading.Thread(target=run_poker_gui, daemon=True)
-                poker_thread.start()
+                self.status_var.set("Starting Poker Research Tool...")
+                self.poker_gui = PokerResearchGUI(master=self.root, on_close=self._poker_closed)
                 
-                messagebox.showinfo(
+                self._toast(
                     "Poker Research Tool",
                     "Poker Research Tool is starting!\n\n"
                     "Features:\n"
@@ -226,13 +308,17 @@ different game types and improve your decision-making skills.
             messagebox.showerror("Error", f"Failed to start Poker Research Tool: {str(e)}")
             self.status_var.set("Ready")
     
+    def _poker_closed(self) -> None:
+        self.poker_gui = None
+        self.status_var.set("Poker Research Tool closed")
+
     def start_both(self):
         """Start both applications"""
         self.start_battle_game()
-        # Small delay to avoid overwhelming the system
-        self.root.after(1000, self.start_poker_research)
+        # Launch the poker tool as soon as the battle game window is up
+        self._start_poker_when_battle_ready()
         
-        messagebox.showinfo(
+        self._toast(
             "Both Applications",
             "Starting both Battle Game and Poker Research Tool!\n\n"
             "You can now:\n"
@@ -241,6 +327,14 @@ different game types and improve your decision-making skills.
             "• Compare strategic thinking across game types"
         )
     
+    def _start_poker_when_battle_ready(self) -> None:
+        proc = self._battle_proc
+        if self._battle_ready.is_set() or proc is None or not proc.is_alive():
+            # Also stop waiting if the battle game failed before becoming ready
+            self.root.after_idle(self.start_poker_research)
+        else:
+            self.root.after(self.READY_POLL_MS, self._start_poker_when_battle_ready)
+
     def run(self):
         """Start the main application"""
         print("Starting Integrated Strategy Game Hub...")
@@ -251,16 +345,11 @@ different game types and improve your decision-making skills.
         """Handle application closing"""
         if messagebox.askokcancel("Quit", "Do you want to quit the Strategy Game Hub?"):
             # Clean up any running games
-            if self.battle_game:
-                try:
-                    pygame.quit()
-                except:
-                    pass
-            
+            self._stop_process(self._battle_proc)
             if self.poker_gui:
                 try:
-                    self.poker_gui.root.destroy()
-                except:
+                    self.poker_gui.close()
+                except tk.TclError:
                     pass
             
             self.root.destroy()
@@ -3,27 +3,202 @@ Poker Research GUI - Integration with Strategy Game
 This module provides a graphical interface for poker GTO analysis and research.
 """
 
-import pygame
+import asyncio
+import bisect
+import functools
+import heapq
+import re
+import sys
+from operator import itemgetter
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox
+from tkinter import ttk, messagebox
+import tkinter.font as tkfont
 import json
 from poker_solver import TexasSolverAPI, PokerResearchTool, Position, PokerAction
-import threading
 from typing import Dict, Optional
 
+
+# One research tool (and solver) shared by every GUI instance in the process
+_RESEARCH_TOOL: Optional[PokerResearchTool] = None
+
+
+def get_research_tool() -> PokerResearchTool:
+    """Return the process-wide PokerResearchTool, creating it on first use"""
+    global _RESEARCH_TOOL
+    if _RESEARCH_TOOL is None:
+        _RESEARCH_TOOL = PokerResearchTool()
+    return _RESEARCH_TOOL
+
+
+# Equity depends only on its arguments, so repeated queries for the same
+# hand are served from this cache.
+@functools.lru_cache(maxsize=4096)
+def _cached_hand_equity(solver: TexasSolverAPI, hand: str, board: str = "", opponents: int = 1) -> float:
+    return solver.calculate_hand_equity(hand, board, opponents)
+
+
+# Input pre-checks, so malformed entries are rejected before reaching the solver.
+# Hands: the solver's canonical forms only, i.e. a pair ("QQ") or the higher
+# rank first plus s/o ("AKs", "T9o"); anything else would silently get the
+# solver's fallback equity.
+_RANKS = "23456789TJQKA"
+_HAND_RE = re.compile(
+    r'^(?:([2-9TJQKA])\1|(?:'
+    + '|'.join(f'{high}[{_RANKS[:i]}]' for i, high in enumerate(_RANKS) if i)
+    + r')[SO])$',
+    re.IGNORECASE,
+)
+# Board: flop, turn or river as concatenated cards (an empty board means preflop)
+_BOARD_RE = re.compile(r'^(?:[2-9TJQKA][CDHS]){3,5}$', re.IGNORECASE)
+# One action history entry, e.g. "UTG raise", "BTN bet 2.5bb", "SB all-in"
+_ACTION_RE = re.compile(
+    r'^(?:UTG|MP|CO|BTN|SB|BB)\s+'
+    r'(?:fold|check|call|limp|bet|raise|[345]-?bet|all[-_ ]?in|shove)'
+    r'(?:\s+\d+(?:\.\d+)?\s*(?:bb|x|%)?)?$',
+    re.IGNORECASE,
+)
+
+
+def _normalize_hand(hand: str) -> str:
+    """Upper-case ranks and lower-case suffix of a hand accepted by _HAND_RE (interned)"""
+    return sys.intern(hand[:2].upper() + hand[2:].lower())
+
+
+# Report wording by bucket. Bounds are ascending; the matching text is
+# TEXTS[bisect_right(BOUNDS, x)] for ">=" thresholds and
+# TEXTS[bisect_left(BOUNDS, x)] for strict ">" thresholds.
+_STRENGTH_BOUNDS = (0.50, 0.60, 0.70)
+_STRENGTH_LABELS = ("Weak", "Marginal", "Strong", "Very Strong")
+
+_EQUITY_ACTION_BOUNDS = (0.55, 0.65)
+_EQUITY_ACTIONS = (
+    "• Fold to significant action\n• Avoid building large pots\n",
+    "• Can call raises in position\n• Consider as bluff catcher\n",
+    "• Suitable for value betting\n• Good for 3-betting preflop\n",
+)
+
+_SPOT_EV_BOUNDS = (0, 0.1)
+_SPOT_EV_RECS = (
+    "• Losing spot on average\n• Consider folding or playing defensively\n",
+    "• Marginally profitable spot\n• Play carefully, avoid big mistakes\n",
+    "• This spot shows positive expected value\n• Continue with aggressive strategy\n",
+)
+
+_WIN_RATE_BOUNDS = (0.50, 0.52, 0.55)
+_PERFORMANCE_LABELS = ("Losing", "Break-even", "Good", "Excellent")
+
+_SIM_EV_BOUNDS = (0, 0.05)
+_SIM_EV_RECS = (
+    "• Negative EV - review and adjust strategy\n• Focus on fundamental improvements\n",
+    "• Slight edge - work on reducing variance\n• Study marginal spots for improvement\n",
+    "• Strong positive EV - continue current strategy\n• Focus on volume to maximize profits\n",
+)
+
+class LazyText(tk.Frame):
+    """
+    Read-only scrolled text that keeps the report as a list of lines and only
+    inserts the lines around the visible window into the Tk widget
+    """
+    
+    # Extra lines rendered past the bottom edge (covers wrapped lines)
+    OVERSCAN = 50
+    
+    def __init__(self, master, height=15, width=80, **kwargs):
+        super().__init__(master)
+        self.text = tk.Text(self, height=height, width=width, state='disabled', **kwargs)
+        self.scrollbar = tk.Scrollbar(self, command=self.yview)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.text.pack(side=tk.LEFT, fill='both', expand=True)
+        self._linespace = tkfont.Font(font=self.text.cget('font')).metrics('linespace')
+        self._lines = []
+        self._top = 0
+        self._rows = None
+        self.text.bind('<Configure>', self._on_configure)
+        self.text.bind('<MouseWheel>', self._on_wheel)
+        self.text.bind('<Button-4>', self._on_wheel)
+        self.text.bind('<Button-5>', self._on_wheel)
+    
+    def set_content(self, content):
+        """Replace the report and scroll back to the top"""
+        self._lines = content.split('\n')
+        self._top = 0
+        self._refresh()
+    
+    def _visible_rows(self):
+        height = self.text.winfo_height()
+        if height <= 1:
+            # Not mapped yet: fall back to the configured height
+            return int(self.text.cget('height'))
+        return max(1, height // self._linespace)
+    
+    def _refresh(self):
+        rows = self._visible_rows()
+        self._rows = rows
+        window = self._lines[self._top:self._top + rows + self.OVERSCAN]
+        self.text.config(state='normal')
+        self.text.delete(1.0, tk.END)
+        self.text.insert('1.0', '\n'.join(window))
+        self.text.config(state='disabled')
+        total = len(self._lines)
+        if total:
+            self.scrollbar.set(self._top / total, min(1.0, (self._top + rows) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+    
+    def yview(self, *args):
+        """Scrollbar command: 'moveto' fraction or 'scroll' n units/pages"""
+        rows = self._visible_rows()
+        if args[0] == 'moveto':
+            top = int(float(args[1]) * len(self._lines))
+        elif args[0] == 'scroll':
+            step = int(args[1])
+            top = self._top + (step * rows if args[2] == 'pages' else step)
+        else:
+            return
+        top = max(0, min(top, len(self._lines) - rows))
+        if top != self._top:
+            self._top = top
+            self._refresh()
+    
+    def _on_configure(self, event):
+        if self._visible_rows() != self._rows:
+            self._refresh()
+    
+    def _on_wheel(self, event):
+        up = event.num == 4 or getattr(event, 'delta', 0) > 0
+        self.yview('scroll', -3 if up else 3, 'units')
+        return "break"
+
 class PokerResearchGUI:
     """
     GUI interface for poker research and GTO analysis
     """
     
-    def __init__(self):
-        self.research_tool = PokerResearchTool()
+    # Interval of the Tk timer that runs one asyncio loop cycle
+    ASYNC_PUMP_MS = 50
+    
+    def __init__(self, master=None, on_close=None):
+        """
+        Args:
+            master: Parent Tk widget. When given, the tool opens as a Toplevel
+                of it and shares the parent's mainloop instead of calling run().
+            on_close: Optional callback invoked after the window is closed.
+        """
+        self.master = master
+        self.on_close = on_close
+        self.research_tool = get_research_tool()
         self.current_analysis = None
+        # Background work is awaited on this loop, driven from Tk by _pump
+        self._loop = asyncio.new_event_loop()
+        # Handlers queued with _coalesce that have not run yet
+        self._pending = set()
+        # Status message waiting for the next idle flush (None: nothing queued)
+        self._status_latest = None
         self.setup_gui()
     
     def setup_gui(self):
         """Initialize the GUI components"""
-        self.root = tk.Tk()
+        self.root = tk.Tk() if self.master is None else tk.Toplevel(self.master)
         self.root.title("TexasSolver GTO Poker Research Tool")
         self.root.geometry("1000x700")
         
@@ -31,11 +206,17 @@ class PokerResearchGUI:
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill='both', expand=True, padx=10, pady=10)
         
-        # Create tabs
-        self.create_range_analysis_tab()
-        self.create_equity_calculator_tab()
-        self.create_spot_analyzer_tab()
-        self.create_simulation_tab()
+        # Create tabs: empty frames now, contents on first visit
+        self._tab_builders = {}
+        for title, builder in (("Range Analysis", self.create_range_analysis_tab),
+                               ("Equity Calculator", self.create_equity_calculator_tab),
+                               ("Spot Analyzer", self.create_spot_analyzer_tab),
+                               ("Tournament Simulation", self.create_simulation_tab)):
+            frame = ttk.Frame(self.notebook)
+            self.notebook.add(frame, text=title)
+            self._tab_builders[str(frame)] = (builder, frame)
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab)
+        self._on_tab()
         
         # Status bar
         self.status_var = tk.StringVar()
@@ -43,12 +224,30 @@ class PokerResearchGUI:
         status_bar = tk.Label(self.root, textvariable=self.status_var, 
                              relief=tk.SUNKEN, anchor=tk.W)
         status_bar.pack(side=tk.BOTTOM, fill=tk.X)
+        
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+        self._pump_id = self.root.after(self.ASYNC_PUMP_MS, self._pump)
     
-    def create_range_analysis_tab(self):
+    def _pump(self):
+        """Run one asyncio loop cycle on the Tk thread, then reschedule"""
+        self._loop.call_soon(self._loop.stop)
+        self._loop.run_forever()
+        self._pump_id = self.root.after(self.ASYNC_PUMP_MS, self._pump)
+    
+    @staticmethod
+    def _render(text_widget, lines):
+        """Replace the contents of a results widget with the joined report lines"""
+        text_widget.set_content(''.join(lines))
+    
+    def _on_tab(self, event=None):
+        """Build the selected tab's widgets the first time it is shown"""
+        entry = self._tab_builders.pop(self.notebook.select(), None)
+        if entry is not None:
+            builder, frame = entry
+            builder(frame)
+    
+    def create_range_analysis_tab(self, range_frame):
         """Create the range analysis tab"""
-        range_frame = ttk.Frame(self.notebook)
-        self.notebook.add(range_frame, text="Range Analysis")
-        
         # Position selection
         pos_frame = ttk.LabelFrame(range_frame, text="Position Selection", padding="10")
         pos_frame.pack(fill='x', padx=10, pady=5)
@@ -68,14 +267,11 @@ class PokerResearchGUI:
         results_frame = ttk.LabelFrame(range_frame, text="Range Analysis Results", padding="10")
         results_frame.pack(fill='both', expand=True, padx=10, pady=5)
         
-        self.range_text = scrolledtext.ScrolledText(results_frame, height=20, width=80)
+        self.range_text = LazyText(results_frame, height=20, width=80)
         self.range_text.pack(fill='both', expand=True)
     
-    def create_equity_calculator_tab(self):
+    def create_equity_calculator_tab(self, equity_frame):
         """Create the equity calculator tab"""
-        equity_frame = ttk.Frame(self.notebook)
-        self.notebook.add(equity_frame, text="Equity Calculator")
-        
         # Input frame
         input_frame = ttk.LabelFrame(equity_frame, text="Hand Analysis", padding="10")
         input_frame.pack(fill='x', padx=10, pady=5)
@@ -106,14 +302,11 @@ class PokerResearchGUI:
         results_frame = ttk.LabelFrame(equity_frame, text="Equity Results", padding="10")
         results_frame.pack(fill='both', expand=True, padx=10, pady=5)
         
-        self.equity_text = scrolledtext.ScrolledText(results_frame, height=15, width=80)
+        self.equity_text = LazyText(results_frame, height=15, width=80)
         self.equity_text.pack(fill='both', expand=True)
     
-    def create_spot_analyzer_tab(self):
+    def create_spot_analyzer_tab(self, spot_frame):
         """Create the spot analyzer tab"""
-        spot_frame = ttk.Frame(self.notebook)
-        self.notebook.add(spot_frame, text="Spot Analyzer")
-        
         # Spot configuration
         config_frame = ttk.LabelFrame(spot_frame, text="Spot Configuration", padding="10")
         config_frame.pack(fill='x', padx=10, pady=5)
@@ -145,14 +338,11 @@ class PokerResearchGUI:
         spot_results_frame = ttk.LabelFrame(spot_frame, text="GTO Solution", padding="10")
         spot_results_frame.pack(fill='both', expand=True, padx=10, pady=5)
         
-        self.spot_text = scrolledtext.ScrolledText(spot_results_frame, height=15, width=80)
+        self.spot_text = LazyText(spot_results_frame, height=15, width=80)
         self.spot_text.pack(fill='both', expand=True)
     
-    def create_simulation_tab(self):
+    def create_simulation_tab(self, sim_frame):
         """Create the simulation tab"""
-        sim_frame = ttk.Frame(self.notebook)
-        self.notebook.add(sim_frame, text="Tournament Simulation")
-        
         # Simulation controls
         control_frame = ttk.LabelFrame(sim_frame, text="Simulation Parameters", padding="10")
         control_frame.pack(fill='x', padx=10, pady=5)
@@ -177,52 +367,80 @@ class PokerResearchGUI:
         sim_results_frame = ttk.LabelFrame(sim_frame, text="Simulation Results", padding="10")
         sim_results_frame.pack(fill='both', expand=True, padx=10, pady=5)
         
-        self.sim_text = scrolledtext.ScrolledText(sim_results_frame, height=15, width=80)
+        self.sim_text = LazyText(sim_results_frame, height=15, width=80)
         self.sim_text.pack(fill='both', expand=True)
     
+    def set_status(self, message):
+        """Queue a status bar message; only the latest one is drawn at idle time"""
+        queued = self._status_latest is not None
+        self._status_latest = message
+        if not queued:
+            self.root.after_idle(self._flush_status)
+    
+    def _flush_status(self):
+        self.status_var.set(self._status_latest)
+        self._status_latest = None
+    
+    def _coalesce(self, key, handler):
+        """Run handler once at idle time, dropping repeat requests until it has run"""
+        if key in self._pending:
+            return
+        self._pending.add(key)
+        self.root.after_idle(self._run_pending, key, handler)
+    
+    def _run_pending(self, key, handler):
+        try:
+            handler()
+        finally:
+            self._pending.discard(key)
+    
     def analyze_range(self):
         """Analyze hand range for selected position"""
+        self._coalesce('range', self._do_analyze_range)
+    
+    def _do_analyze_range(self):
         try:
             position = Position(self.position_var.get())
-            self.status_var.set(f"Analyzing {position.value} range...")
+            self.set_status(f"Analyzing {position.value} range...")
             
             range_analysis = self.research_tool.solver.analyze_preflop_range(position)
             
             # Display results
-            self.range_text.delete(1.0, tk.END)
-            self.range_text.insert(tk.END, f"=== {position.value} Opening Range ===\n\n")
+            lines = [f"=== {position.value} Opening Range ===\n\n"]
             
-            # Sort hands by frequency
-            sorted_hands = sorted(range_analysis.hands.items(), 
-                                key=lambda x: x[1], reverse=True)
+            # Hands actually played, ordered by frequency (zero-frequency entries add nothing to the sum)
+            nonzero = [(h, f) for h, f in range_analysis.hands.items() if f > 0]
+            total_hands = len(nonzero)
+            avg_frequency = sum(f for h, f in nonzero) / len(range_analysis.hands)
+            sorted_hands = heapq.nlargest(total_hands, nonzero, key=itemgetter(1))
             
-            self.range_text.insert(tk.END, f"Range Size: {len([h for h, f in sorted_hands if f > 0])} hands\n\n")
+            lines.append(f"Range Size: {total_hands} hands\n\n")
             
-            self.range_text.insert(tk.END, "Hand Frequencies:\n")
+            lines.append("Hand Frequencies:\n")
             for hand, frequency in sorted_hands:
-                if frequency > 0:
-                    percentage = frequency * 100
-                    equity = self.research_tool.solver.calculate_hand_equity(hand)
-                    self.range_text.insert(tk.END, 
-                                         f"{hand:4s}: {percentage:5.1f}% frequency, {equity:5.1%} equity\n")
+                percentage = frequency * 100
+                equity = _cached_hand_equity(self.research_tool.solver, hand)
+                lines.append(f"{hand:4s}: {percentage:5.1f}% frequency, {equity:5.1%} equity\n")
             
             # Add range statistics
-            total_hands = len([h for h, f in sorted_hands if f > 0])
-            avg_frequency = sum(f for h, f in sorted_hands) / len(sorted_hands)
             
-            self.range_text.insert(tk.END, f"\n=== Range Statistics ===\n")
-            self.range_text.insert(tk.END, f"Total hands in range: {total_hands}\n")
-            self.range_text.insert(tk.END, f"Average frequency: {avg_frequency:.3f}\n")
-            self.range_text.insert(tk.END, f"Range tightness: {total_hands/169:.1%} of all hands\n")
+            lines.append(f"\n=== Range Statistics ===\n")
+            lines.append(f"Total hands in range: {total_hands}\n")
+            lines.append(f"Average frequency: {avg_frequency:.3f}\n")
+            lines.append(f"Range tightness: {total_hands/169:.1%} of all hands\n")
+            self._render(self.range_text, lines)
             
-            self.status_var.set("Range analysis complete")
+            self.set_status("Range analysis complete")
             
         except Exception as e:
             messagebox.showerror("Error", f"Range analysis failed: {str(e)}")
-            self.status_var.set("Ready")
+            self.set_status("Ready")
     
     def calculate_equity(self):
         """Calculate hand equity"""
+        self._coalesce('equity', self._do_calculate_equity)
+    
+    def _do_calculate_equity(self):
         try:
             hand = self.hand_entry.get().strip()
             board = self.board_entry.get().strip()
@@ -231,167 +449,179 @@ class PokerResearchGUI:
             if not hand:
                 messagebox.showwarning("Warning", "Please enter a hand")
                 return
+            if not _HAND_RE.match(hand):
+                messagebox.showwarning("Warning", f"Invalid hand: {hand} (e.g. AKo, QQ, T9s)")
+                return
+            if board and not _BOARD_RE.match(board):
+                messagebox.showwarning("Warning", f"Invalid board: {board} (3-5 cards, e.g. AhKs2d)")
+                return
+            if not 1 <= opponents <= 9:
+                messagebox.showwarning("Warning", "Opponents must be between 1 and 9")
+                return
+            hand = _normalize_hand(hand)
             
-            self.status_var.set("Calculating equity...")
+            self.set_status("Calculating equity...")
             
-            equity = self.research_tool.solver.calculate_hand_equity(hand, board, opponents)
+            equity = _cached_hand_equity(self.research_tool.solver, hand, board, opponents)
             
             # Display results
-            self.equity_text.delete(1.0, tk.END)
-            self.equity_text.insert(tk.END, f"=== Equity Analysis ===\n\n")
-            self.equity_text.insert(tk.END, f"Hero Hand: {hand}\n")
-            self.equity_text.insert(tk.END, f"Board: {board if board else 'Preflop'}\n")
-            self.equity_text.insert(tk.END, f"Opponents: {opponents}\n\n")
-            self.equity_text.insert(tk.END, f"Equity: {equity:.1%}\n\n")
+            lines = [f"=== Equity Analysis ===\n\n"]
+            lines.append(f"Hero Hand: {hand}\n")
+            lines.append(f"Board: {board if board else 'Preflop'}\n")
+            lines.append(f"Opponents: {opponents}\n\n")
+            lines.append(f"Equity: {equity:.1%}\n\n")
             
             # Add hand strength analysis
-            if equity >= 0.70:
-                strength = "Very Strong"
-            elif equity >= 0.60:
-                strength = "Strong"
-            elif equity >= 0.50:
-                strength = "Marginal"
-            else:
-                strength = "Weak"
+            strength = _STRENGTH_LABELS[bisect.bisect_right(_STRENGTH_BOUNDS, equity)]
             
-            self.equity_text.insert(tk.END, f"Hand Strength: {strength}\n")
+            lines.append(f"Hand Strength: {strength}\n")
             
             # Add recommended actions
-            self.equity_text.insert(tk.END, f"\n=== Recommended Actions ===\n")
-            if equity >= 0.65:
-                self.equity_text.insert(tk.END, "• Suitable for value betting\n")
-                self.equity_text.insert(tk.END, "• Good for 3-betting preflop\n")
-            elif equity >= 0.55:
-                self.equity_text.insert(tk.END, "• Can call raises in position\n")
-                self.equity_text.insert(tk.END, "• Consider as bluff catcher\n")
-            else:
-                self.equity_text.insert(tk.END, "• Fold to significant action\n")
-                self.equity_text.insert(tk.END, "• Avoid building large pots\n")
-            
-            self.status_var.set("Equity calculation complete")
+            lines.append(f"\n=== Recommended Actions ===\n")
+            lines.append(_EQUITY_ACTIONS[bisect.bisect_right(_EQUITY_ACTION_BOUNDS, equity)])
+            self._render(self.equity_text, lines)
+            
+            self.set_status("Equity calculation complete")
             
         except Exception as e:
             messagebox.showerror("Error", f"Equity calculation failed: {str(e)}")
-            self.status_var.set("Ready")
+            self.set_status("Ready")
     
     def analyze_spot(self):
         """Analyze specific poker spot"""
+        self._coalesce('spot', self._do_analyze_spot)
+    
+    def _do_analyze_spot(self):
         try:
             hero_pos = Position(self.hero_pos_var.get())
             stack_size = int(self.stack_entry.get())
             action_history = self.action_entry.get().strip().split(', ')
+            invalid = [a for a in action_history if a and not _ACTION_RE.match(a.strip())]
+            if invalid:
+                messagebox.showwarning("Warning", f"Invalid action: {invalid[0]} (e.g. UTG raise, MP fold)")
+                return
             
-            self.status_var.set("Analyzing poker spot...")
+            self.set_status("Analyzing poker spot...")
             
             solution = self.research_tool.solver.analyze_spot(
                 hero_pos, action_history, {hero_pos: stack_size}
             )
             
             # Display results
-            self.spot_text.delete(1.0, tk.END)
-            self.spot_text.insert(tk.END, f"=== GTO Spot Analysis ===\n\n")
-            self.spot_text.insert(tk.END, f"Hero Position: {hero_pos.value}\n")
-            self.spot_text.insert(tk.END, f"Stack Size: {stack_size} BB\n")
-            self.spot_text.insert(tk.END, f"Action History: {', '.join(action_history)}\n\n")
+            lines = [f"=== GTO Spot Analysis ===\n\n"]
+            lines.append(f"Hero Position: {hero_pos.value}\n")
+            lines.append(f"Stack Size: {stack_size} BB\n")
+            lines.append(f"Action History: {', '.join(action_history)}\n\n")
             
-            self.spot_text.insert(tk.END, f"Expected Value: {solution.ev:+.3f} BB\n")
-            self.spot_text.insert(tk.END, f"Exploitability: {solution.exploitability:.3f}\n\n")
+            lines.append(f"Expected Value: {solution.ev:+.3f} BB\n")
+            lines.append(f"Exploitability: {solution.exploitability:.3f}\n\n")
             
             # Show recommended ranges
             for position, range_data in solution.ranges.items():
-                self.spot_text.insert(tk.END, f"=== {position.value} Strategy ===\n")
-                hands_in_range = [h for h, f in range_data.hands.items() if f > 0]
-                self.spot_text.insert(tk.END, f"Range size: {len(hands_in_range)} hands\n")
-                self.spot_text.insert(tk.END, f"Action: {range_data.action.value}\n\n")
+                lines.append(f"=== {position.value} Strategy ===\n")
+                lines.append(f"Range size: {range_data.active_size} hands\n")
+                lines.append(f"Action: {range_data.action.value}\n\n")
                 
                 # Show top hands
-                sorted_hands = sorted(range_data.hands.items(), 
-                                    key=lambda x: x[1], reverse=True)[:10]
-                self.spot_text.insert(tk.END, "Top hands:\n")
+                sorted_hands = heapq.nlargest(10, range_data.hands.items(), key=itemgetter(1))
+                lines.append("Top hands:\n")
                 for hand, freq in sorted_hands:
                     if freq > 0:
-                        self.spot_text.insert(tk.END, f"  {hand}: {freq:.1%}\n")
-                self.spot_text.insert(tk.END, "\n")
+                        lines.append(f"  {hand}: {freq:.1%}\n")
+                lines.append("\n")
             
             # Add strategic recommendations
-            self.spot_text.insert(tk.END, "=== Strategic Recommendations ===\n")
-            if solution.ev > 0.1:
-                self.spot_text.insert(tk.END, "• This spot shows positive expected value\n")
-                self.spot_text.insert(tk.END, "• Continue with aggressive strategy\n")
-            elif solution.ev > 0:
-                self.spot_text.insert(tk.END, "• Marginally profitable spot\n")
-                self.spot_text.insert(tk.END, "• Play carefully, avoid big mistakes\n")
-            else:
-                self.spot_text.insert(tk.END, "• Losing spot on average\n")
-                self.spot_text.insert(tk.END, "• Consider folding or playing defensively\n")
-            
-            self.status_var.set("Spot analysis complete")
+            lines.append("=== Strategic Recommendations ===\n")
+            lines.append(_SPOT_EV_RECS[bisect.bisect_left(_SPOT_EV_BOUNDS, solution.ev)])
+            self._render(self.spot_text, lines)
+            
+            self.set_status("Spot analysis complete")
             
         except Exception as e:
             messagebox.showerror("Error", f"Spot analysis failed: {str(e)}")
-            self.status_var.set("Ready")
+            self.set_status("Ready")
     
     def run_simulation(self):
         """Run tournament simulation"""
-        def simulation_thread():
-            try:
-                num_sims = int(self.sim_count_entry.get())
-                self.sim_button.config(state='disabled')
-                self.progress_var.set(0)
-                
-                # Run simulation with progress updates
-                results = self.research_tool.simulate_tournament_spots(num_sims)
-                
-                # Display results
-                self.sim_text.delete(1.0, tk.END)
-                self.sim_text.insert(tk.END, f"=== Tournament Simulation Results ===\n\n")
-                self.sim_text.insert(tk.END, f"Simulations Run: {num_sims:,}\n")
-                self.sim_text.insert(tk.END, f"Average EV: {results['avg_ev']:+.4f} BB\n")
-                self.sim_text.insert(tk.END, f"Win Rate: {results['win_rate']:.1%}\n\n")
-                
-                # Calculate additional statistics
-                hourly_ev = results['avg_ev'] * 100  # Assuming 100 hands per hour
-                self.sim_text.insert(tk.END, f"Projected Hourly EV: {hourly_ev:+.2f} BB/hour\n")
-                
-                if results['win_rate'] > 0.55:
-                    performance = "Excellent"
-                elif results['win_rate'] > 0.52:
-                    performance = "Good"
-                elif results['win_rate'] > 0.50:
-                    performance = "Break-even"
-                else:
-                    performance = "Losing"
-                
-                self.sim_text.insert(tk.END, f"Performance Rating: {performance}\n\n")
-                
-                # Add recommendations
-                self.sim_text.insert(tk.END, "=== Recommendations ===\n")
-                if results['avg_ev'] > 0.05:
-                    self.sim_text.insert(tk.END, "• Strong positive EV - continue current strategy\n")
-                    self.sim_text.insert(tk.END, "• Focus on volume to maximize profits\n")
-                elif results['avg_ev'] > 0:
-                    self.sim_text.insert(tk.END, "• Slight edge - work on reducing variance\n")
-                    self.sim_text.insert(tk.END, "• Study marginal spots for improvement\n")
-                else:
-                    self.sim_text.insert(tk.END, "• Negative EV - review and adjust strategy\n")
-                    self.sim_text.insert(tk.END, "• Focus on fundamental improvements\n")
-                
-                self.progress_var.set(100)
-                self.status_var.set("Simulation complete")
-                
-            except Exception as e:
-                messagebox.showerror("Error", f"Simulation failed: {str(e)}")
-                self.status_var.set("Ready")
-            finally:
-                self.sim_button.config(state='normal')
+        self._coalesce('sim', self._start_simulation)
+    
+    def _start_simulation(self):
+        try:
+            num_sims = int(self.sim_count_entry.get())
+        except ValueError as e:
+            messagebox.showerror("Error", f"Simulation failed: {str(e)}")
+            self.set_status("Ready")
+            return
         
-        # Run simulation in background thread
-        threading.Thread(target=simulation_thread, daemon=True).start()
-        self.status_var.set("Running simulation...")
+        self.sim_button.config(state='disabled')
+        self.progress_var.set(0)
+        self._loop.create_task(self._run_simulation_async(num_sims))
+        self.set_status("Running simulation...")
+    
+    async def _run_simulation_async(self, num_sims):
+        """Run the simulation in the loop's default executor and hand the results back to Tk"""
+        # A worker thread rather than a process pool: the solver answers in constant
+        # time, so worker processes would cost far more to start than the computation
+        try:
+            results = await self._loop.run_in_executor(
+                None, self.research_tool.simulate_tournament_spots, num_sims)
+        except Exception as e:
+            self.root.after_idle(self._simulation_failed, e)
+        else:
+            self.root.after_idle(self._render_sim_results, num_sims, results)
+    
+    def _simulation_failed(self, error):
+        messagebox.showerror("Error", f"Simulation failed: {str(error)}")
+        self.set_status("Ready")
+        self.sim_button.config(state='normal')
+    
+    def _render_sim_results(self, num_sims, results):
+        """Display simulation results (runs on the Tk thread)"""
+        try:
+            lines = [f"=== Tournament Simulation Results ===\n\n"]
+            lines.append(f"Simulations Run: {num_sims:,}\n")
+            lines.append(f"Average EV: {results['avg_ev']:+.4f} BB\n")
+            lines.append(f"Win Rate: {results['win_rate']:.1%}\n\n")
+            
+            # Calculate additional statistics
+            hourly_ev = results['avg_ev'] * 100  # Assuming 100 hands per hour
+            lines.append(f"Projected Hourly EV: {hourly_ev:+.2f} BB/hour\n")
+            
+            performance = _PERFORMANCE_LABELS[bisect.bisect_left(_WIN_RATE_BOUNDS, results['win_rate'])]
+            
+            lines.append(f"Performance Rating: {performance}\n\n")
+            
+            # Add recommendations
+            lines.append("=== Recommendations ===\n")
+            lines.append(_SIM_EV_RECS[bisect.bisect_left(_SIM_EV_BOUNDS, results['avg_ev'])])
+            self._render(self.sim_text, lines)
+            
+            self.progress_var.set(100)
+            self.set_status("Simulation complete")
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Simulation failed: {str(e)}")
+            self.set_status("Ready")
+        finally:
+            self.sim_button.config(state='normal')
+    
+    def _shutdown(self):
+        self._loop.close()
+    
+    def close(self):
+        """Close the window and release the event loop"""
+        self.root.after_cancel(self._pump_id)
+        self._shutdown()
+        self.root.destroy()
+        if self.on_close:
+            self.on_close()
     
     def run(self):
-        """Start the GUI application"""
-        self.root.mainloop()
+        """Start the GUI application (standalone mode only)"""
+        try:
+            self.root.mainloop()
+        finally:
+            self._shutdown()
 
 def main():
     """Main function to run the poker research GUI"""
@@ -3,12 +3,23 @@ TexasSolver GTO Poker API Integration
 This module provides GTO (Game Theory Optimal) poker analysis functionality for research purposes.
 """
 
-import requests
 import json
-from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
+import functools
+import sys
+import threading
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, List, Mapping, Tuple, Optional, Union
+from dataclasses import dataclass, field
 from enum import Enum
 
+try:
+    import orjson  # optional: faster range export
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    import requests  # imported on first session use; it is slow to load
+
 class PokerAction(Enum):
     FOLD = "fold"
     CALL = "call"
@@ -25,38 +36,52 @@ class Position(Enum):
     MP = "MP"    # Middle Position
     CO = "CO"    # Cutoff
 
-@dataclass
+# Result types are frozen so shared and cached instances cannot be modified.
+# eq=True/unsafe_hash=False is deliberate: HandRange, BetSizingPlan,
+# PostflopStrategy and GTOSolution hold mapping fields, so they are immutable
+# but not hashable (hash() raises TypeError). Compare them, don't use them as keys.
+@dataclass(frozen=True, eq=True, unsafe_hash=False, slots=True)
 class HandRange:
     """Represents a poker hand range with associated frequencies"""
-    hands: Dict[str, float]  # hand -> frequency
+    hands: Mapping[str, float]  # hand -> frequency
     position: Position
     action: PokerAction
-
-@dataclass
+    # Number of hands played with a positive frequency, counted once per range
+    active_size: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Caller-supplied ranges are snapshotted read-only with interned hand
+        # keys; the built-in tables are already frozen literals
+        if not isinstance(self.hands, MappingProxyType):
+            object.__setattr__(self, 'hands', MappingProxyType(
+                {sys.intern(hand): frequency for hand, frequency in self.hands.items()}))
+        object.__setattr__(self, 'active_size', sum(1 for frequency in self.hands.values() if frequency > 0))
+
+@dataclass(frozen=True, slots=True)
 class PokerHand:
     """Represents a specific poker hand"""
     cards: str  # e.g., "AhKs" for Ace of hearts, King of spades
     strength: float
     equity: float
 
-@dataclass
+@dataclass(frozen=True, eq=True, unsafe_hash=False, slots=True)
 class BetSizingPlan:
     """Represents equilibrium bet sizing recommendations across streets"""
     stack_size: int
     pot_size: float
-    street_recommendations: Dict[str, Dict[str, float]]
+    street_recommendations: Dict[str, Mapping[str, float]]  # postflop streets are shared, read-only
     notes: str
 
-@dataclass
+@dataclass(frozen=True, eq=True, unsafe_hash=False, slots=True)
 class PostflopStrategy:
     """Summarizes equilibrium-inspired postflop guidance"""
     board: str
     category: str
     hero_range_advantage: str
-    recommended_actions: Dict[str, str]
-    blocker_applications: List[str]
+    recommended_actions: Mapping[str, str]  # shared, read-only
+    blocker_applications: Tuple[str, ...]
 
-@dataclass
+@dataclass(frozen=True, eq=True, unsafe_hash=False, slots=True)
 class GTOSolution:
     """Represents a GTO solution for a specific situation"""
     ranges: Dict[Position, HandRange]
@@ -66,6 +91,384 @@ class GTOSolution:
     postflop_strategy: Optional[PostflopStrategy] = None
     blocker_explanation: Optional[str] = None
 
+def _freeze(table):
+    """Recursively wrap nested dicts in read-only MappingProxyType views"""
+    if isinstance(table, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in table.items()})
+    return table
+
+_EMPTY: Mapping[str, float] = MappingProxyType({})
+
+# Valid position strings, mapped to the enum's own value objects
+_POSITION_KEYS: Mapping[str, str] = MappingProxyType({pos.value: pos.value for pos in Position})
+
+def _position_key(position: Union[Position, str]) -> Optional[str]:
+    """Key into the position tables; a Position or its string value, anything else matches no entry"""
+    if isinstance(position, Position):
+        return position.value
+    return _POSITION_KEYS.get(position) if isinstance(position, str) else None
+
+# Stack-aware preflop ranges approximating equilibrium adjustments.
+# Position-keyed tables use Position.value: str hashes are cached, Enum hashes are not.
+_PREFLOP_RANGES: Mapping[str, Mapping[str, Mapping[str, float]]] = _freeze({
+    "UTG": {
+        "deep": {
+            'AA': 1.0, 'KK': 1.0, 'QQ': 1.0, 'JJ': 1.0, 'TT': 1.0,
+            'AKs': 1.0, 'AKo': 1.0, 'AQs': 1.0, 'AQo': 0.8,
+            'AJs': 1.0, 'AJo': 0.6, 'ATs': 1.0, 'KQs': 1.0,
+            '99': 1.0, '88': 0.8, '77': 0.6
+        },
+        "mid": {
+            'AA': 1.0, 'KK': 1.0, 'QQ': 1.0, 'JJ': 1.0, 'TT': 1.0,
+            'AKs': 1.0, 'AKo': 1.0, 'AQs': 1.0, 'AQo': 0.7,
+            'AJs': 1.0, 'ATs': 0.9, 'KQs': 0.9,
+            '99': 0.9, '88': 0.7, '77': 0.5
+        },
+        "short": {
+            'AA': 1.0, 'KK': 1.0, 'QQ': 1.0, 'JJ': 1.0,
+            'AKs': 1.0, 'AKo': 1.0, 'AQs': 0.9,
+            'TT': 0.9, '99': 0.8, 'AQo': 0.5
+        }
+    },
+    "MP": {
+        "deep": {
+            'AA': 1.0, 'KK': 1.0, 'QQ': 1.0, 'JJ': 1.0, 'TT': 1.0, '99': 1.0,
+            'AKs': 1.0, 'AKo': 1.0, 'AQs': 1.0, 'AQo': 1.0, 'AJs': 1.0,
+            'AJo': 0.8, 'ATs': 1.0, 'ATo': 0.6, 'KQs': 1.0, 'KQo': 0.7,
+            'KJs': 1.0, 'KJo': 0.5, '88': 1.0, '77': 0.8, '66': 0.6
+        },
+        "mid": {
+            'AA': 1.0, 'KK': 1.0, 'QQ': 1.0, 'JJ': 1.0, 'TT': 1.0,
+            'AKs': 1.0, 'AKo': 1.0, 'AQs': 1.0, 'AQo': 0.9,
+            'AJs': 1.0, 'ATs': 0.9, 'KQs': 0.9, 'KJs': 0.9,
+            '99': 0.9, '88': 0.8, '77': 0.6, '66': 0.5, '55': 0.4
+        },
+        "short": {
+            'AA': 1.0, 'KK': 1.0, 'QQ': 1.0, 'JJ': 1.0,
+            'AKs': 1.0, 'AKo': 1.0, 'AQs': 0.9, 'AQo': 0.7,
+            'TT': 1.0, '99': 0.9, '88': 0.7, '77': 0.5
+        }
+    },
+    "CO": {
+        "deep": {
+            'AA': 1.0, 'KK': 1.0, 'QQ': 1.0, 'JJ': 1.0, 'TT': 1.0, '99': 1.0, '88': 1.0,
+            'AKs': 1.0, 'AKo': 1.0, 'AQs': 1.0, 'AQo': 1.0, 'AJs': 1.0, 'AJo': 1.0,
+            'ATs': 1.0, 'ATo': 0.8, 'A9s': 1.0, 'A8s': 0.8, 'A7s': 0.6,
+            'KQs': 1.0, 'KQo': 1.0, 'KJs': 1.0, 'KJo': 0.8, 'KTs': 1.0,
+            '77': 1.0, '66': 0.8, '55': 0.6, '44': 0.4
+        },
+        "mid": {
+            'AA': 1.0, 'KK': 1.0, 'QQ': 1.0, 'JJ': 1.0, 'TT': 1.0, '99': 1.0,
+            'AKs': 1.0, 'AKo': 1.0, 'AQs': 1.0, 'AQo': 1.0, 'AJs': 1.0,
+            'AJo': 0.9, 'ATs': 0.9, 'A9s': 0.9, 'A8s': 0.7,
+            'KQs': 1.0, 'KQo': 0.9, 'KJs': 0.9, 'KJo': 0.7, 'KTs': 0.9,
+            '88': 1.0, '77': 0.9, '66': 0.7, '55': 0.5
+        },
+        "short": {
+            'AA': 1.0, 'KK': 1.0, 'QQ': 1.0, 'JJ': 1.0,
+            'AKs': 1.0, 'AKo': 1.0, 'AQs': 1.0, 'AQo': 0.9, 'AJs': 1.0,
+            'KQs': 0.9, 'KJs': 0.8, 'TT': 1.0, '99': 0.9, '88': 0.8,
+            'ATs': 0.8, 'A9s': 0.7
+        }
+    },
+    "BTN": {
+        "deep": {
+            'AA': 1.0, 'KK': 1.0, 'QQ': 1.0, 'JJ': 1.0, 'TT': 1.0, '99': 1.0, '88': 1.0, '77': 1.0,
+            'AKs': 1.0, 'AKo': 1.0, 'AQs': 1.0, 'AQo': 1.0, 'AJs': 1.0, 'AJo': 1.0,
+            'ATs': 1.0, 'ATo': 1.0, 'A9s': 1.0, 'A9o': 0.8, 'A8s': 1.0, 'A7s': 1.0,
+            'A6s': 0.8, 'A5s': 1.0, 'A4s': 1.0, 'A3s': 0.8, 'A2s': 0.8,
+            'KQs': 1.0, 'KQo': 1.0, 'KJs': 1.0, 'KJo': 1.0, 'KTs': 1.0, 'KTo': 0.8,
+            '66': 1.0, '55': 1.0, '44': 1.0, '33': 0.8, '22': 0.8,
+            'QJs': 1.0, 'QJo': 0.8, 'QTs': 1.0, 'Q9s': 0.8, 'JTs': 1.0, 'J9s': 0.8,
+            'T9s': 1.0, '98s': 1.0, '87s': 1.0
+        },
+        "mid": {
+            'AA': 1.0, 'KK': 1.0, 'QQ': 1.0, 'JJ': 1.0, 'TT': 1.0, '99': 1.0,
+            'AKs': 1.0, 'AKo': 1.0, 'AQs': 1.0, 'AQo': 1.0, 'AJs': 1.0, 'AJo': 1.0,
+            'ATs': 1.0, 'ATo': 0.9, 'A9s': 1.0, 'A8s': 0.9, 'A7s': 0.9,
+            'KQs': 1.0, 'KQo': 1.0, 'KJs': 1.0, 'KJo': 0.9, 'KTs': 1.0,
+            '66': 1.0, '55': 1.0, '44': 0.9, '33': 0.7, '22': 0.7,
+            'QJs': 1.0, 'QTs': 1.0, 'JTs': 1.0, 'T9s': 1.0, '98s': 0.9
+        },
+        "short": {
+            'AA': 1.0, 'KK': 1.0, 'QQ': 1.0, 'JJ': 1.0, 'TT': 1.0,
+            'AKs': 1.0, 'AKo': 1.0, 'AQs': 1.0, 'AQo': 1.0, 'AJs': 1.0,
+            'ATs': 0.9, 'A9s': 0.9, 'KQs': 1.0, 'KJs': 0.9,
+            '99': 0.9, '88': 0.8, '77': 0.7, '66': 0.6,
+            'QJs': 0.9, 'JTs': 0.9, 'T9s': 0.9
+        }
+    },
+    "SB": {
+        "deep": {
+            'AA': 1.0, 'KK': 1.0, 'QQ': 1.0, 'JJ': 1.0, 'TT': 1.0, '99': 1.0, '88': 1.0, '77': 1.0,
+            'AKs': 1.0, 'AKo': 1.0, 'AQs': 1.0, 'AQo': 1.0, 'AJs': 1.0, 'AJo': 1.0,
+            'ATs': 1.0, 'ATo': 1.0, 'A9s': 1.0, 'A8s': 1.0, 'A7s': 1.0, 'A6s': 1.0,
+            'A5s': 1.0, 'A4s': 1.0, 'A3s': 1.0, 'A2s': 1.0,
+            'KQs': 1.0, 'KQo': 1.0, 'KJs': 1.0, 'KJo': 1.0, 'KTs': 1.0, 'KTo': 1.0,
+            'K9s': 1.0, 'K8s': 0.8, 'K7s': 0.6, 'K6s': 0.4,
+            '66': 1.0, '55': 1.0, '44': 1.0, '33': 1.0, '22': 1.0,
+            'QJs': 1.0, 'QTs': 1.0, 'Q9s': 1.0, 'Q8s': 0.8,
+            'JTs': 1.0, 'J9s': 1.0, 'J8s': 0.8, 'T9s': 1.0, 'T8s': 0.8
+        },
+        "mid": {
+            'AA': 1.0, 'KK': 1.0, 'QQ': 1.0, 'JJ': 1.0, 'TT': 1.0, '99': 1.0,
+            'AKs': 1.0, 'AKo': 1.0, 'AQs': 1.0, 'AQo': 1.0, 'AJs': 1.0, 'AJo': 1.0,
+            'ATs': 1.0, 'ATo': 1.0, 'A9s': 1.0, 'A8s': 1.0, 'A7s': 1.0,
+            'A6s': 1.0, 'A5s': 1.0, 'A4s': 1.0, 'A3s': 0.9, 'A2s': 0.9,
+            'KQs': 1.0, 'KQo': 1.0, 'KJs': 1.0, 'KJo': 0.9, 'KTs': 1.0,
+            'K9s': 0.9, 'K8s': 0.7, 'K7s': 0.5,
+            '66': 1.0, '55': 1.0, '44': 1.0, '33': 0.9, '22': 0.9,
+            'QJs': 1.0, 'QTs': 1.0, 'Q9s': 0.9,
+            'JTs': 1.0, 'J9s': 0.9, 'T9s': 0.9
+        },
+        "short": {
+            'AA': 1.0, 'KK': 1.0, 'QQ': 1.0, 'JJ': 1.0, 'TT': 1.0,
+            'AKs': 1.0, 'AKo': 1.0, 'AQs': 1.0, 'AQo': 1.0, 'AJs': 1.0,
+            'ATs': 1.0, 'A9s': 1.0, 'KQs': 1.0, 'KJs': 0.9,
+            '99': 1.0, '88': 0.9, '77': 0.8, '66': 0.7,
+            'A5s': 0.9, 'A4s': 0.9, 'QJs': 0.9, 'JTs': 0.9
+        }
+    },
+    "BB": {
+        "deep": {
+            'AA': 1.0, 'KK': 1.0, 'QQ': 1.0, 'JJ': 1.0, 'TT': 1.0, '99': 1.0, '88': 1.0, '77': 1.0,
+            'AKs': 1.0, 'AKo': 1.0, 'AQs': 1.0, 'AQo': 1.0, 'AJs': 1.0, 'AJo': 1.0,
+            'ATs': 1.0, 'ATo': 1.0, 'A9s': 1.0, 'A9o': 0.8, 'A8s': 1.0, 'A8o': 0.6,
+            'A7s': 1.0, 'A6s': 1.0, 'A5s': 1.0, 'A4s': 1.0, 'A3s': 1.0, 'A2s': 1.0,
+            'KQs': 1.0, 'KQo': 1.0, 'KJs': 1.0, 'KJo': 1.0, 'KTs': 1.0, 'KTo': 0.8,
+            'K9s': 1.0, 'K8s': 1.0, 'K7s': 1.0, 'K6s': 0.8, 'K5s': 0.6,
+            '66': 1.0, '55': 1.0, '44': 1.0, '33': 1.0, '22': 1.0,
+            'QJs': 1.0, 'QTs': 1.0, 'Q9s': 1.0, 'Q8s': 1.0, 'Q7s': 0.8,
+            'JTs': 1.0, 'J9s': 1.0, 'J8s': 1.0, 'J7s': 0.8,
+            'T9s': 1.0, 'T8s': 1.0, 'T7s': 0.8, '98s': 1.0, '97s': 0.8, '87s': 1.0
+        },
+        "mid": {
+            'AA': 1.0, 'KK': 1.0, 'QQ': 1.0, 'JJ': 1.0, 'TT': 1.0, '99': 1.0,
+            'AKs': 1.0, 'AKo': 1.0, 'AQs': 1.0, 'AQo': 1.0, 'AJs': 1.0,
+            'ATs': 1.0, 'ATo': 0.9, 'A9s': 1.0, 'A8s': 1.0, 'A8o': 0.7,
+            'KQs': 1.0, 'KQo': 1.0, 'KJs': 1.0, 'KTs': 1.0, 'KTo': 0.7,
+            'K9s': 1.0, 'K8s': 0.9, 'K7s': 0.9, 'K6s': 0.7,
+            'QJs': 1.0, 'QTs': 1.0, 'Q9s': 1.0, 'Q8s': 0.9,
+            'JTs': 1.0, 'J9s': 1.0, 'J8s': 0.9,
+            'T9s': 1.0, 'T8s': 0.9, '98s': 1.0, '87s': 0.9
+        },
+        "short": {
+            'AA': 1.0, 'KK': 1.0, 'QQ': 1.0, 'JJ': 1.0, 'TT': 1.0,
+            'AKs': 1.0, 'AKo': 1.0, 'AQs': 1.0, 'AQo': 0.9,
+            'AJs': 1.0, 'ATs': 0.9, 'KQs': 1.0, 'KJs': 0.9,
+            '99': 1.0, '88': 0.9, '77': 0.8, '66': 0.7,
+            'QJs': 0.9, 'JTs': 0.9, 'T9s': 0.9, '98s': 0.9
+        }
+    }
+})
+
+# Stack-aware bet sizing tables used by get_bet_sizing_plan
+_PREFLOP_OPEN_SIZES = _freeze({
+    "deep": {
+        "UTG": 2.5,
+        "MP": 2.3,
+        "CO": 2.2,
+        "BTN": 2.1,
+        "SB": 3.0
+    },
+    "mid": {
+        "UTG": 2.3,
+        "MP": 2.2,
+        "CO": 2.1,
+        "BTN": 2.0,
+        "SB": 2.8
+    },
+    "short": {
+        "UTG": 2.2,
+        "MP": 2.1,
+        "CO": 2.0,
+        "BTN": 2.0,
+        "SB": 2.5
+    }
+})
+
+_EARLY_POSITIONS = frozenset({"UTG", "MP", "CO"})
+_LATE_POSITIONS = frozenset({"BTN", "SB"})
+_STEAL_POSITIONS = frozenset({"CO", "BTN"})
+_BLINDS = frozenset({"SB", "BB"})
+
+_THREE_BET_SIZES = _freeze({"deep": 3.2, "mid": 3.0, "short": 2.6})
+_FOUR_BET_SIZES = _freeze({"deep": 2.5, "mid": 2.2, "short": 2.0})
+_SHOVE_THRESHOLD = _freeze({"deep": 0, "mid": 30, "short": 22})
+
+_FLOP_SIZING = _freeze({
+    "deep": {"small": 0.33, "big": 0.75, "raise": 2.8, "shove": 2.5},
+    "mid": {"small": 0.40, "big": 0.70, "raise": 2.5, "shove": 2.2},
+    "short": {"small": 0.45, "big": 0.60, "raise": 2.2, "shove": 1.8}
+})
+
+_TURN_SIZING = _freeze({
+    "deep": {"small": 0.60, "big": 1.10, "raise": 2.4, "shove": 2.2},
+    "mid": {"small": 0.65, "big": 1.00, "raise": 2.1, "shove": 1.8},
+    "short": {"small": 0.70, "big": 0.90, "raise": 1.8, "shove": 1.6}
+})
+
+_RIVER_SIZING = _freeze({
+    "deep": {"small": 0.70, "big": 1.35, "raise": 2.2, "shove": 2.0},
+    "mid": {"small": 0.75, "big": 1.20, "raise": 2.0, "shove": 1.7},
+    "short": {"small": 0.80, "big": 1.10, "raise": 1.7, "shove": 1.5}
+})
+
+# One bit per rank (2 = bit 0 ... A = bit 12) and per suit for bitmask board analysis
+_RANK_BIT: Mapping[str, int] = MappingProxyType({rank: 1 << i for i, rank in enumerate("23456789TJQKA")})
+_SUIT_BIT: Mapping[str, int] = MappingProxyType({suit: 1 << i for i, suit in enumerate("shdc")})
+_ALL_RANKS = (1 << 13) - 1
+_HIGH_RANKS = sum(_RANK_BIT[rank] for rank in "TJQKA")
+
+def _char_masks(chars: str, bits: Mapping[str, int], spare: int) -> Tuple[int, int]:
+    """
+    Single pass over board characters
+    
+    Returns:
+        (bits of distinct characters, bits of characters seen more than once);
+        unknown characters land above bit `spare`
+    """
+    seen = repeated = 0
+    for c in chars:
+        bit = bits.get(c) or 1 << (spare + ord(c))
+        repeated |= seen & bit
+        seen |= bit
+    return seen, repeated
+
+# Postflop action advice by board texture ("paired" covers paired_high and paired_low)
+_RECOMMENDED_ACTIONS: Mapping[str, Mapping[str, str]] = _freeze({
+    "dry_high": {
+        "flop": "C-bet ~33% with entire range, checking only slowplays and the weakest backdoor hands.",
+        "turn": "On bricks, polarize between 65% and 110% pot; slow down when overcards help villain.",
+        "river": "Use 130% overbets with nut advantage, mix 70% value bets when ranges condense."
+    },
+    "dynamic": {
+        "flop": "Mix 45% checks with 60-70% pot bets using top pair+ and strong draws; bet small with gutters plus backdoors.",
+        "turn": "Accelerate on favorable turns with 75-100% pot; mix in check-raises holding combo draws.",
+        "river": "Arrive polarized; bluff missed draws that block straights while value-betting big with two pair+."
+    },
+    "monotone": {
+        "flop": "Check range ~55%; bet 50% pot with nut advantage and strong blockers to deny equity.",
+        "turn": "When suit pairs, attack with 80% pot leveraging nut flush advantage; otherwise keep sizing to 60%.",
+        "river": "Select polarized 120% bets with nut blockers, check medium strength to bluff catch."
+    },
+    "paired": {
+        "flop": "Range stab 33% to deny equity; mix in checks with underpairs to protect checking range.",
+        "turn": "Double barrel 65% when unpaired overcards fall; slow down on coordinated cards.",
+        "river": "Shove or bet 120% with quads/full houses; thin value 55% with overpairs blocking boats."
+    },
+    "low_connected": {
+        "flop": "Check 50%+; bet 45% pot with overpairs and strong draws, mixing some large bets with sets.",
+        "turn": "Pressure with 70% pot on bricks; overbet when straight advantage persists.",
+        "river": "Bluff missed overcards blocking straights; value bet 65% with overpairs."
+    },
+    "dry_low": {
+        "flop": "Adopt balanced 40% frequency bets (~50% pot) to probe; check-call marginal made hands.",
+        "turn": "Select 70% pot barrels when range retains nut advantage, otherwise check with medium pairs.",
+        "river": "Use 75% pot value bets for straights+; choose bluff combos that block villain's top pairs."
+    }
+})
+
+_SHORT_STACK_SUFFIX = {
+    "turn": " Adjust frequencies downward to avoid stack-commitment without equity.",
+    "river": " Choose shove-or-fold decisions based on nut blockers."
+}
+# Short-stack variants are built once so analyze_postflop_spot never edits strings
+_SHORT_STACK_ACTIONS: Mapping[str, Mapping[str, str]] = _freeze({
+    texture: {street: advice + _SHORT_STACK_SUFFIX.get(street, "") for street, advice in actions.items()}
+    for texture, actions in _RECOMMENDED_ACTIONS.items()
+})
+
+# Heads-up equity by canonical starting hand for the simplified equity model
+_HAND_STRENGTH: Mapping[str, float] = _freeze({
+    'AA': 0.85, 'KK': 0.82, 'QQ': 0.80, 'JJ': 0.77, 'TT': 0.75,
+    'AKs': 0.67, 'AKo': 0.65, 'AQs': 0.66, 'AQo': 0.64,
+    'AJs': 0.65, 'AJo': 0.63, 'ATs': 0.64, 'ATo': 0.62,
+    'KQs': 0.63, 'KQo': 0.61, 'KJs': 0.62, 'KJo': 0.60,
+    '99': 0.72, '88': 0.69, '77': 0.66, '66': 0.63,
+    '55': 0.60, '44': 0.57, '33': 0.54, '22': 0.51
+})
+_DEFAULT_HAND_STRENGTH = 0.50
+_OPPONENT_DECAY = 0.85  # equity multiplier per additional opponent
+
+# Final equities for 1.._MAX_TABLE_OPPONENTS opponents, indexed by opponents - 1
+_MAX_TABLE_OPPONENTS = 9
+_OPPONENT_MULTIPLIERS = tuple(_OPPONENT_DECAY ** k for k in range(_MAX_TABLE_OPPONENTS))
+
+def _equity_row(strength: float) -> Tuple[float, ...]:
+    return tuple(min(strength * multiplier, 1.0) for multiplier in _OPPONENT_MULTIPLIERS)
+
+_EQUITY_BY_OPPONENTS: Mapping[str, Tuple[float, ...]] = MappingProxyType(
+    {hand: _equity_row(strength) for hand, strength in _HAND_STRENGTH.items()}
+)
+_DEFAULT_EQUITY_ROW = _equity_row(_DEFAULT_HAND_STRENGTH)
+
+@functools.lru_cache(maxsize=64)
+def _preflop_range(position: Union[Position, str], stack_profile: str, can_raise: bool) -> HandRange:
+    """
+    Shared, immutable preflop range for a position and stack bucket
+    
+    Returns:
+        HandRange: RAISE range when can_raise, otherwise ALL_IN
+    """
+    position_ranges = _PREFLOP_RANGES.get(_position_key(position), _EMPTY)
+    hand_range = position_ranges.get(stack_profile, position_ranges.get("deep", _EMPTY))
+    recommended_action = PokerAction.RAISE if can_raise else PokerAction.ALL_IN
+    return HandRange(hands=hand_range, position=position, action=recommended_action)
+
+@functools.lru_cache(maxsize=32)
+def _bet_plan_prototype(position_key: Optional[str], stack_profile: str) -> Tuple[
+        Mapping[str, float], int, Mapping[str, Mapping[str, float]], str]:
+    """
+    Stack-size independent part of a bet sizing plan, gathered in one lookup
+    
+    Returns:
+        (preflop sizes without the shove entry, shove cap (0 = stack size),
+         shared postflop street sizings, notes template with a {stack} field)
+    """
+    open_size = _PREFLOP_OPEN_SIZES[stack_profile].get(position_key, 2.3)
+    three_bet = _THREE_BET_SIZES[stack_profile]
+    four_bet = _FOUR_BET_SIZES[stack_profile]
+    preflop = MappingProxyType({"open": open_size, "three_bet": three_bet, "four_bet": four_bet})
+    postflop = MappingProxyType({
+        "flop": _FLOP_SIZING[stack_profile],
+        "turn": _TURN_SIZING[stack_profile],
+        "river": _RIVER_SIZING[stack_profile]
+    })
+    notes_template = (
+        f"{{stack}}bb effective stack ({stack_profile}) -> open {open_size:.1f}bb, "
+        f"3-bet {three_bet:.1f}x, 4-bet {four_bet:.1f}x. "
+        "Postflop sizings expand when deep to pressure condensed ranges and contract when shallow to preserve stack leverage."
+    )
+    return preflop, _SHOVE_THRESHOLD[stack_profile], postflop, notes_template
+
+_SESSION: Optional["requests.Session"] = None
+_SESSION_LOCK = threading.Lock()
+
+def _shared_session() -> "requests.Session":
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                import requests
+                _SESSION = requests.Session()
+    return _SESSION
+
+_BLOCKER_FOOTER = (
+    "Balancing these blockers with value combos keeps betting ranges within solver-approved bluff:value ratios."
+)
+
+@functools.lru_cache(maxsize=2048)
+def _blocker_explanation(board: str, blocker_applications: Tuple[str, ...]) -> str:
+    """Formatted blocker explanation; boards repeat, so the text is built once per board"""
+    explanation_lines = [
+        f"On board {board}, blockers dictate combo availability and therefore bluffing frequency.",
+        "Key blocker applications:"
+    ]
+    explanation_lines.extend(f"- {note}" for note in blocker_applications)
+    explanation_lines.append(_BLOCKER_FOOTER)
+    return "\n".join(explanation_lines)
+
 class TexasSolverAPI:
     """
     TexasSolver GTO Poker API Client
@@ -75,9 +478,13 @@ class TexasSolverAPI:
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key
         self.base_url = "https://api.texassolver.com/v1"  # Hypothetical API endpoint
-        self.session = requests.Session()
-        if api_key:
-            self.session.headers.update({"Authorization": f"Bearer {api_key}"})
+        # Passed per request, since the session is shared by all clients
+        self.headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+
+    @property
+    def session(self) -> "requests.Session":
+        """HTTP session shared by all clients, created on first use"""
+        return _shared_session()
 
     def _determine_stack_bucket(self, stack_size: int) -> str:
         if stack_size >= 80:
@@ -86,7 +493,7 @@ class TexasSolverAPI:
             return "mid"
         return "short"
 
-    def analyze_preflop_range(self, position: Position, stack_size: int = 100) -> HandRange:
+    def analyze_preflop_range(self, position: Union[Position, str], stack_size: int = 100) -> HandRange:
         """
         Analyze optimal preflop hand range for a given position
 
@@ -98,243 +505,22 @@ class TexasSolverAPI:
             HandRange: Optimal hand range with frequencies
         """
         stack_profile = self._determine_stack_bucket(stack_size)
+        return _preflop_range(position, stack_profile, stack_size >= 20)
 
-        # Stack-aware preflop ranges approximating equilibrium adjustments
-        ranges = {
-            Position.UTG: {
-                "deep": {
-                    'AA': 1.0, 'KK': 1.0, 'QQ': 1.0, 'JJ': 1.0, 'TT': 1.0,
-                    'AKs': 1.0, 'AKo': 1.0, 'AQs': 1.0, 'AQo': 0.8,
-                    'AJs': 1.0, 'AJo': 0.6, 'ATs': 1.0, 'KQs': 1.0,
-                    '99': 1.0, '88': 0.8, '77': 0.6
-                },
-                "mid": {
-                    'AA': 1.0, 'KK': 1.0, 'QQ': 1.0, 'JJ': 1.0, 'TT': 1.0,
-                    'AKs': 1.0, 'AKo': 1.0, 'AQs': 1.0, 'AQo': 0.7,
-                    'AJs': 1.0, 'ATs': 0.9, 'KQs': 0.9,
-                    '99': 0.9, '88': 0.7, '77': 0.5
-                },
-                "short": {
-                    'AA': 1.0, 'KK': 1.0, 'QQ': 1.0, 'JJ': 1.0,
-                    'AKs': 1.0, 'AKo': 1.0, 'AQs': 0.9,
-                    'TT': 0.9, '99': 0.8, 'AQo': 0.5
-                }
-            },
-            Position.MP: {
-                "deep": {
-                    'AA': 1.0, 'KK': 1.0, 'QQ': 1.0, 'JJ': 1.0, 'TT': 1.0, '99': 1.0,
-                    'AKs': 1.0, 'AKo': 1.0, 'AQs': 1.0, 'AQo': 1.0, 'AJs': 1.0,
-                    'AJo': 0.8, 'ATs': 1.0, 'ATo': 0.6, 'KQs': 1.0, 'KQo': 0.7,
-                    'KJs': 1.0, 'KJo': 0.5, '88': 1.0, '77': 0.8, '66': 0.6
-                },
-                "mid": {
-                    'AA': 1.0, 'KK': 1.0, 'QQ': 1.0, 'JJ': 1.0, 'TT': 1.0,
-                    'AKs': 1.0, 'AKo': 1.0, 'AQs': 1.0, 'AQo': 0.9,
-                    'AJs': 1.0, 'ATs': 0.9, 'KQs': 0.9, 'KJs': 0.9,
-                    '99': 0.9, '88': 0.8, '77': 0.6, '66': 0.5, '55': 0.4
-                },
-                "short": {
-                    'AA': 1.0, 'KK': 1.0, 'QQ': 1.0, 'JJ': 1.0,
-                    'AKs': 1.0, 'AKo': 1.0, 'AQs': 0.9, 'AQo': 0.7,
-                    'TT': 1.0, '99': 0.9, '88': 0.7, '77': 0.5
-                }
-            },
-            Position.CO: {
-                "deep": {
-                    'AA': 1.0, 'KK': 1.0, 'QQ': 1.0, 'JJ': 1.0, 'TT': 1.0, '99': 1.0, '88': 1.0,
-                    'AKs': 1.0, 'AKo': 1.0, 'AQs': 1.0, 'AQo': 1.0, 'AJs': 1.0, 'AJo': 1.0,
-                    'ATs': 1.0, 'ATo': 0.8, 'A9s': 1.0, 'A8s': 0.8, 'A7s': 0.6,
-                    'KQs': 1.0, 'KQo': 1.0, 'KJs': 1.0, 'KJo': 0.8, 'KTs': 1.0,
-                    '77': 1.0, '66': 0.8, '55': 0.6, '44': 0.4
-                },
-                "mid": {
-                    'AA': 1.0, 'KK': 1.0, 'QQ': 1.0, 'JJ': 1.0, 'TT': 1.0, '99': 1.0,
-                    'AKs': 1.0, 'AKo': 1.0, 'AQs': 1.0, 'AQo': 1.0, 'AJs': 1.0,
-                    'AJo': 0.9, 'ATs': 0.9, 'A9s': 0.9, 'A8s': 0.7,
-                    'KQs': 1.0, 'KQo': 0.9, 'KJs': 0.9, 'KJo': 0.7, 'KTs': 0.9,
-                    '88': 1.0, '77': 0.9, '66': 0.7, '55': 0.5
-                },
-                "short": {
-                    'AA': 1.0, 'KK': 1.0, 'QQ': 1.0, 'JJ': 1.0,
-                    'AKs': 1.0, 'AKo': 1.0, 'AQs': 1.0, 'AQo': 0.9, 'AJs': 1.0,
-                    'KQs': 0.9, 'KJs': 0.8, 'TT': 1.0, '99': 0.9, '88': 0.8,
-                    'ATs': 0.8, 'A9s': 0.7
-                }
-            },
-            Position.BTN: {
-                "deep": {
-                    'AA': 1.0, 'KK': 1.0, 'QQ': 1.0, 'JJ': 1.0, 'TT': 1.0, '99': 1.0, '88': 1.0, '77': 1.0,
-                    'AKs': 1.0, 'AKo': 1.0, 'AQs': 1.0, 'AQo': 1.0, 'AJs': 1.0, 'AJo': 1.0,
-                    'ATs': 1.0, 'ATo': 1.0, 'A9s': 1.0, 'A9o': 0.8, 'A8s': 1.0, 'A7s': 1.0,
-                    'A6s': 0.8, 'A5s': 1.0, 'A4s': 1.0, 'A3s': 0.8, 'A2s': 0.8,
-                    'KQs': 1.0, 'KQo': 1.0, 'KJs': 1.0, 'KJo': 1.0, 'KTs': 1.0, 'KTo': 0.8,
-                    '66': 1.0, '55': 1.0, '44': 1.0, '33': 0.8, '22': 0.8,
-                    'QJs': 1.0, 'QJo': 0.8, 'QTs': 1.0, 'Q9s': 0.8, 'JTs': 1.0, 'J9s': 0.8,
-                    'T9s': 1.0, '98s': 1.0, '87s': 1.0
-                },
-                "mid": {
-                    'AA': 1.0, 'KK': 1.0, 'QQ': 1.0, 'JJ': 1.0, 'TT': 1.0, '99': 1.0,
-                    'AKs': 1.0, 'AKo': 1.0, 'AQs': 1.0, 'AQo': 1.0, 'AJs': 1.0, 'AJo': 1.0,
-                    'ATs': 1.0, 'ATo': 0.9, 'A9s': 1.0, 'A8s': 0.9, 'A7s': 0.9,
-                    'KQs': 1.0, 'KQo': 1.0, 'KJs': 1.0, 'KJo': 0.9, 'KTs': 1.0,
-                    '66': 1.0, '55': 1.0, '44': 0.9, '33': 0.7, '22': 0.7,
-                    'QJs': 1.0, 'QTs': 1.0, 'JTs': 1.0, 'T9s': 1.0, '98s': 0.9
-                },
-                "short": {
-                    'AA': 1.0, 'KK': 1.0, 'QQ': 1.0, 'JJ': 1.0, 'TT': 1.0,
-                    'AKs': 1.0, 'AKo': 1.0, 'AQs': 1.0, 'AQo': 1.0, 'AJs': 1.0,
-                    'ATs': 0.9, 'A9s': 0.9, 'KQs': 1.0, 'KJs': 0.9,
-                    '99': 0.9, '88': 0.8, '77': 0.7, '66': 0.6,
-                    'QJs': 0.9, 'JTs': 0.9, 'T9s': 0.9
-                }
-            },
-            Position.SB: {
-                "deep": {
-                    'AA': 1.0, 'KK': 1.0, 'QQ': 1.0, 'JJ': 1.0, 'TT': 1.0, '99': 1.0, '88': 1.0, '77': 1.0,
-                    'AKs': 1.0, 'AKo': 1.0, 'AQs': 1.0, 'AQo': 1.0, 'AJs': 1.0, 'AJo': 1.0,
-                    'ATs': 1.0, 'ATo': 1.0, 'A9s': 1.0, 'A8s': 1.0, 'A7s': 1.0, 'A6s': 1.0,
-                    'A5s': 1.0, 'A4s': 1.0, 'A3s': 1.0, 'A2s': 1.0,
-                    'KQs': 1.0, 'KQo': 1.0, 'KJs': 1.0, 'KJo': 1.0, 'KTs': 1.0, 'KTo': 1.0,
-                    'K9s': 1.0, 'K8s': 0.8, 'K7s': 0.6, 'K6s': 0.4,
-                    '66': 1.0, '55': 1.0, '44': 1.0, '33': 1.0, '22': 1.0,
-                    'QJs': 1.0, 'QTs': 1.0, 'Q9s': 1.0, 'Q8s': 0.8,
-                    'JTs': 1.0, 'J9s': 1.0, 'J8s': 0.8, 'T9s': 1.0, 'T8s': 0.8
-                },
-                "mid": {
-                    'AA': 1.0, 'KK': 1.0, 'QQ': 1.0, 'JJ': 1.0, 'TT': 1.0, '99': 1.0,
-                    'AKs': 1.0, 'AKo': 1.0, 'AQs': 1.0, 'AQo': 1.0, 'AJs': 1.0, 'AJo': 1.0,
-                    'ATs': 1.0, 'ATo': 1.0, 'A9s': 1.0, 'A8s': 1.0, 'A7s': 1.0,
-                    'A6s': 1.0, 'A5s': 1.0, 'A4s': 1.0, 'A3s': 0.9, 'A2s': 0.9,
-                    'KQs': 1.0, 'KQo': 1.0, 'KJs': 1.0, 'KJo': 0.9, 'KTs': 1.0,
-                    'K9s': 0.9, 'K8s': 0.7, 'K7s': 0.5,
-                    '66': 1.0, '55': 1.0, '44': 1.0, '33': 0.9, '22': 0.9,
-                    'QJs': 1.0, 'QTs': 1.0, 'Q9s': 0.9,
-                    'JTs': 1.0, 'J9s': 0.9, 'T9s': 0.9
-                },
-                "short": {
-                    'AA': 1.0, 'KK': 1.0, 'QQ': 1.0, 'JJ': 1.0, 'TT': 1.0,
-                    'AKs': 1.0, 'AKo': 1.0, 'AQs': 1.0, 'AQo': 1.0, 'AJs': 1.0,
-                    'ATs': 1.0, 'A9s': 1.0, 'KQs': 1.0, 'KJs': 0.9,
-                    '99': 1.0, '88': 0.9, '77': 0.8, '66': 0.7,
-                    'A5s': 0.9, 'A4s': 0.9, 'QJs': 0.9, 'JTs': 0.9
-                }
-            },
-            Position.BB: {
-                "deep": {
-                    'AA': 1.0, 'KK': 1.0, 'QQ': 1.0, 'JJ': 1.0, 'TT': 1.0, '99': 1.0, '88': 1.0, '77': 1.0,
-                    'AKs': 1.0, 'AKo': 1.0, 'AQs': 1.0, 'AQo': 1.0, 'AJs': 1.0, 'AJo': 1.0,
-                    'ATs': 1.0, 'ATo': 1.0, 'A9s': 1.0, 'A9o': 0.8, 'A8s': 1.0, 'A8o': 0.6,
-                    'A7s': 1.0, 'A6s': 1.0, 'A5s': 1.0, 'A4s': 1.0, 'A3s': 1.0, 'A2s': 1.0,
-                    'KQs': 1.0, 'KQo': 1.0, 'KJs': 1.0, 'KJo': 1.0, 'KTs': 1.0, 'KTo': 0.8,
-                    'K9s': 1.0, 'K8s': 1.0, 'K7s': 1.0, 'K6s': 0.8, 'K5s': 0.6,
-                    '66': 1.0, '55': 1.0, '44': 1.0, '33': 1.0, '22': 1.0,
-                    'QJs': 1.0, 'QTs': 1.0, 'Q9s': 1.0, 'Q8s': 1.0, 'Q7s': 0.8,
-                    'JTs': 1.0, 'J9s': 1.0, 'J8s': 1.0, 'J7s': 0.8,
-                    'T9s': 1.0, 'T8s': 1.0, 'T7s': 0.8, '98s': 1.0, '97s': 0.8, '87s': 1.0
-                },
-                "mid": {
-                    'AA': 1.0, 'KK': 1.0, 'QQ': 1.0, 'JJ': 1.0, 'TT': 1.0, '99': 1.0,
-                    'AKs': 1.0, 'AKo': 1.0, 'AQs': 1.0, 'AQo': 1.0, 'AJs': 1.0,
-                    'ATs': 1.0, 'ATo': 0.9, 'A9s': 1.0, 'A8s': 1.0, 'A8o': 0.7,
-                    'KQs': 1.0, 'KQo': 1.0, 'KJs': 1.0, 'KTs': 1.0, 'KTo': 0.7,
-                    'K9s': 1.0, 'K8s': 0.9, 'K7s': 0.9, 'K6s': 0.7,
-                    'QJs': 1.0, 'QTs': 1.0, 'Q9s': 1.0, 'Q8s': 0.9,
-                    'JTs': 1.0, 'J9s': 1.0, 'J8s': 0.9,
-                    'T9s': 1.0, 'T8s': 0.9, '98s': 1.0, '87s': 0.9
-                },
-                "short": {
-                    'AA': 1.0, 'KK': 1.0, 'QQ': 1.0, 'JJ': 1.0, 'TT': 1.0,
-                    'AKs': 1.0, 'AKo': 1.0, 'AQs': 1.0, 'AQo': 0.9,
-                    'AJs': 1.0, 'ATs': 0.9, 'KQs': 1.0, 'KJs': 0.9,
-                    '99': 1.0, '88': 0.9, '77': 0.8, '66': 0.7,
-                    'QJs': 0.9, 'JTs': 0.9, 'T9s': 0.9, '98s': 0.9
-                }
-            }
-        }
-
-        position_ranges = ranges.get(position, {})
-        hand_range = position_ranges.get(stack_profile, position_ranges.get("deep", {}))
-        recommended_action = PokerAction.RAISE if stack_size >= 20 else PokerAction.ALL_IN
-
-        return HandRange(hands=hand_range, position=position, action=recommended_action)
-
-    def get_bet_sizing_plan(self, position: Position, stack_size: int, pot_size: float) -> BetSizingPlan:
+    def get_bet_sizing_plan(self, position: Union[Position, str], stack_size: int, pot_size: float) -> BetSizingPlan:
         """Generate a stack-aware bet sizing plan across all streets"""
 
         stack_profile = self._determine_stack_bucket(stack_size)
+        preflop, shove_cap, postflop, notes_template = _bet_plan_prototype(_position_key(position), stack_profile)
 
-        preflop_open_sizes = {
-            "deep": {
-                Position.UTG: 2.5,
-                Position.MP: 2.3,
-                Position.CO: 2.2,
-                Position.BTN: 2.1,
-                Position.SB: 3.0
-            },
-            "mid": {
-                Position.UTG: 2.3,
-                Position.MP: 2.2,
-                Position.CO: 2.1,
-                Position.BTN: 2.0,
-                Position.SB: 2.8
-            },
-            "short": {
-                Position.UTG: 2.2,
-                Position.MP: 2.1,
-                Position.CO: 2.0,
-                Position.BTN: 2.0,
-                Position.SB: 2.5
-            }
-        }
-
-        three_bet_sizes = {"deep": 3.2, "mid": 3.0, "short": 2.6}
-        four_bet_sizes = {"deep": 2.5, "mid": 2.2, "short": 2.0}
-        shove_threshold = {"deep": 0, "mid": 30, "short": 22}
-
-        flop_sizing = {
-            "deep": {"small": 0.33, "big": 0.75, "raise": 2.8, "shove": 2.5},
-            "mid": {"small": 0.40, "big": 0.70, "raise": 2.5, "shove": 2.2},
-            "short": {"small": 0.45, "big": 0.60, "raise": 2.2, "shove": 1.8}
-        }
-
-        turn_sizing = {
-            "deep": {"small": 0.60, "big": 1.10, "raise": 2.4, "shove": 2.2},
-            "mid": {"small": 0.65, "big": 1.00, "raise": 2.1, "shove": 1.8},
-            "short": {"small": 0.70, "big": 0.90, "raise": 1.8, "shove": 1.6}
-        }
-
-        river_sizing = {
-            "deep": {"small": 0.70, "big": 1.35, "raise": 2.2, "shove": 2.0},
-            "mid": {"small": 0.75, "big": 1.20, "raise": 2.0, "shove": 1.7},
-            "short": {"small": 0.80, "big": 1.10, "raise": 1.7, "shove": 1.5}
-        }
-
-        open_size = preflop_open_sizes[stack_profile].get(position, 2.3)
-        shove_cap = shove_threshold[stack_profile]
-
-        notes = (
-            f"{stack_size}bb effective stack ({stack_profile}) -> open {open_size:.1f}bb, "
-            f"3-bet {three_bet_sizes[stack_profile]:.1f}x, 4-bet {four_bet_sizes[stack_profile]:.1f}x. "
-            "Postflop sizings expand when deep to pressure condensed ranges and contract when shallow to preserve stack leverage."
-        )
-
-        street_recommendations = {
-            "preflop": {
-                "open": open_size,
-                "three_bet": three_bet_sizes[stack_profile],
-                "four_bet": four_bet_sizes[stack_profile],
-                "shove": shove_cap if shove_cap else stack_size
-            },
-            "flop": flop_sizing[stack_profile],
-            "turn": turn_sizing[stack_profile],
-            "river": river_sizing[stack_profile]
-        }
+        street_recommendations = {"preflop": dict(preflop, shove=shove_cap if shove_cap else stack_size)}
+        street_recommendations.update(postflop)
 
         return BetSizingPlan(
             stack_size=stack_size,
             pot_size=pot_size,
             street_recommendations=street_recommendations,
-            notes=notes
+            notes=notes_template.format(stack=stack_size)
         )
 
     def calculate_hand_equity(self, hand: str, board: str = "", opponents: int = 1) -> float:
@@ -349,27 +535,22 @@ class TexasSolverAPI:
         Returns:
             float: Equity percentage (0.0 to 1.0)
         """
-        # Simplified equity calculation based on hand strength
-        hand_strength_map = {
-            'AA': 0.85, 'KK': 0.82, 'QQ': 0.80, 'JJ': 0.77, 'TT': 0.75,
-            'AKs': 0.67, 'AKo': 0.65, 'AQs': 0.66, 'AQo': 0.64,
-            'AJs': 0.65, 'AJo': 0.63, 'ATs': 0.64, 'ATo': 0.62,
-            'KQs': 0.63, 'KQo': 0.61, 'KJs': 0.62, 'KJo': 0.60,
-            '99': 0.72, '88': 0.69, '77': 0.66, '66': 0.63,
-            '55': 0.60, '44': 0.57, '33': 0.54, '22': 0.51
-        }
+        # Common opponent counts are served from the precomputed table
+        if isinstance(opponents, int) and 1 <= opponents <= _MAX_TABLE_OPPONENTS:
+            return _EQUITY_BY_OPPONENTS.get(hand, _DEFAULT_EQUITY_ROW)[opponents - 1]
         
-        # Get base equity
-        base_equity = hand_strength_map.get(hand, 0.50)
+        # Simplified equity calculation based on hand strength
+        base_equity = _HAND_STRENGTH.get(hand, _DEFAULT_HAND_STRENGTH)
         
         # Adjust for number of opponents
-        adjusted_equity = base_equity * (0.85 ** (opponents - 1))
+        adjusted_equity = base_equity * (_OPPONENT_DECAY ** (opponents - 1))
         
-        return min(adjusted_equity, 1.0)
+        # Still needed here: fewer than one opponent inflates the equity above 1.0
+        return adjusted_equity if adjusted_equity < 1.0 else 1.0
     
-    def analyze_spot(self, position: Position, action_history: List[str],
+    def analyze_spot(self, position: Union[Position, str], action_history: List[str],
                     stack_sizes: Dict[Position, int], board: str = "",
-                    pot_size: float = 0.0, villain_position: Optional[Position] = None) -> GTOSolution:
+                    pot_size: float = 0.0, villain_position: Optional[Union[Position, str]] = None) -> GTOSolution:
         """
         Analyze a specific poker spot and provide GTO solution
 
@@ -387,13 +568,14 @@ class TexasSolverAPI:
         effective_stack = stack_sizes.get(position, 100)
         preflop_range = self.analyze_preflop_range(position, stack_size=effective_stack)
 
+        position_key = _position_key(position)
         if villain_position is None:
-            villain_position = next((pos for pos in stack_sizes.keys() if pos != position), Position.BB)
+            villain_position = next((pos for pos in stack_sizes.keys() if _position_key(pos) != position_key), Position.BB)
         villain_stack = stack_sizes.get(villain_position, effective_stack)
         effective_stack = min(effective_stack, villain_stack)
 
         if pot_size <= 0:
-            pot_size = 3.0 if position in {Position.CO, Position.BTN} else 2.5
+            pot_size = 3.0 if position_key in _STEAL_POSITIONS else 2.5
 
         bet_plan = self.get_bet_sizing_plan(position, effective_stack, pot_size)
 
@@ -414,7 +596,7 @@ class TexasSolverAPI:
             blocker_explanation=blocker_explanation
         )
     
-    def get_optimal_sizing(self, pot_size: float, position: Position,
+    def get_optimal_sizing(self, pot_size: float, position: Union[Position, str],
                           action: PokerAction, stack_size: int = 100,
                           street: str = "flop") -> float:
         """
@@ -430,45 +612,46 @@ class TexasSolverAPI:
         Returns:
             float: Optimal bet size as fraction of pot
         """
-        plan = self.get_bet_sizing_plan(position, stack_size, pot_size)
+        # Read the cached sizing tables directly rather than building a full plan
+        stack_profile = self._determine_stack_bucket(stack_size)
+        preflop_plan, shove_cap, postflop, _ = _bet_plan_prototype(_position_key(position), stack_profile)
 
         if street == "preflop":
-            preflop_plan = plan.street_recommendations["preflop"]
-            if action == PokerAction.RAISE:
+            if action is PokerAction.RAISE:
                 return preflop_plan["three_bet"] * pot_size
-            if action == PokerAction.ALL_IN:
-                shove_size = min(stack_size, preflop_plan["shove"])
+            if action is PokerAction.ALL_IN:
+                shove_size = min(stack_size, shove_cap if shove_cap else stack_size)
                 return shove_size * pot_size
             return preflop_plan["open"] * pot_size
 
-        street_plan = plan.street_recommendations.get(street, {})
+        street_plan = postflop.get(street, _EMPTY)
 
-        if action == PokerAction.BET:
+        if action is PokerAction.BET:
             return street_plan.get("small", 0.6) * pot_size
-        if action == PokerAction.RAISE:
+        if action is PokerAction.RAISE:
             return street_plan.get("raise", street_plan.get("big", 0.9)) * pot_size
-        if action == PokerAction.ALL_IN:
+        if action is PokerAction.ALL_IN:
             shove_multiplier = street_plan.get("shove", 1.0)
             return min(stack_size, shove_multiplier * pot_size)
 
         return street_plan.get("small", 0.5) * pot_size
 
-    def _parse_board(self, board: str) -> Tuple[List[str], List[str]]:
-        ranks = [board[i] for i in range(0, len(board), 2)]
-        suits = [board[i + 1] for i in range(0, len(board), 2) if i + 1 < len(board)]
-        return ranks, suits
-
-    def _categorize_board(self, ranks: List[str], suits: List[str]) -> str:
-        rank_order = "23456789TJQKA"
-        indices = [rank_order.index(r) for r in ranks if r in rank_order]
-        if not indices:
-            indices = [0]
-        spread = max(indices) - min(indices)
-        unique_suits = set(suits)
-        is_monotone = len(unique_suits) == 1
-        is_two_tone = len(unique_suits) == 2
-        is_paired = len(ranks) != len(set(ranks))
-        high_cards = sum(1 for r in ranks if r in "TJQKA")
+    def _parse_board(self, board: str) -> Tuple[str, str]:
+        return board[0::2], board[1::2]
+
+    def _categorize_board(self, ranks: str, suits: str) -> str:
+        rank_mask, paired_mask = _char_masks(ranks, _RANK_BIT, 13)
+        suit_mask, _ = _char_masks(suits, _SUIT_BIT, 4)
+        card_ranks = rank_mask & _ALL_RANKS
+        # Highest set bit minus lowest set bit (0 when no valid ranks)
+        spread = card_ranks.bit_length() - (card_ranks & -card_ranks).bit_length()
+        suit_count = suit_mask.bit_count()
+        is_monotone = suit_count == 1
+        is_two_tone = suit_count == 2
+        is_paired = paired_mask != 0
+        # Distinct high ranks; this only undercounts on paired boards, where
+        # just "at least one" matters
+        high_cards = (rank_mask & _HIGH_RANKS).bit_count()
         top_rank = ranks[0] if ranks else ""
 
         if is_monotone:
@@ -488,84 +671,28 @@ class TexasSolverAPI:
         return "dry_low"
 
     def analyze_postflop_spot(self, board: str, pot_size: float, stack_size: int,
-                              position: Position, villain_position: Position) -> PostflopStrategy:
+                              position: Union[Position, str], villain_position: Union[Position, str]) -> PostflopStrategy:
         ranks, suits = self._parse_board(board)
         category = self._categorize_board(ranks, suits)
         stack_profile = self._determine_stack_bucket(stack_size)
 
+        position_key = _position_key(position)
+        villain_key = _position_key(villain_position)
         hero_advantage = "balanced"
-        if position in {Position.UTG, Position.MP, Position.CO} and villain_position in {Position.SB, Position.BB}:
+        if position_key in _EARLY_POSITIONS and villain_key in _BLINDS:
             if category in {"dry_high", "paired_high"}:
                 hero_advantage = "significant"
             elif category in {"monotone", "dynamic"}:
                 hero_advantage = "slight"
-        elif position in {Position.BTN, Position.SB} and villain_position == Position.BB:
+        elif position_key in _LATE_POSITIONS and villain_key == "BB":
             if category in {"dynamic", "monotone"}:
                 hero_advantage = "slight"
             else:
                 hero_advantage = "neutral"
 
-        recommended_actions = {}
-        if category == "dry_high":
-            recommended_actions["flop"] = (
-                "C-bet ~33% with entire range, checking only slowplays and the weakest backdoor hands."
-            )
-            recommended_actions["turn"] = (
-                "On bricks, polarize between 65% and 110% pot; slow down when overcards help villain."
-            )
-            recommended_actions["river"] = (
-                "Use 130% overbets with nut advantage, mix 70% value bets when ranges condense."
-            )
-        elif category == "dynamic":
-            recommended_actions["flop"] = (
-                "Mix 45% checks with 60-70% pot bets using top pair+ and strong draws; bet small with gutters plus backdoors."
-            )
-            recommended_actions["turn"] = (
-                "Accelerate on favorable turns with 75-100% pot; mix in check-raises holding combo draws."
-            )
-            recommended_actions["river"] = (
-                "Arrive polarized; bluff missed draws that block straights while value-betting big with two pair+."
-            )
-        elif category == "monotone":
-            recommended_actions["flop"] = (
-                "Check range ~55%; bet 50% pot with nut advantage and strong blockers to deny equity."
-            )
-            recommended_actions["turn"] = (
-                "When suit pairs, attack with 80% pot leveraging nut flush advantage; otherwise keep sizing to 60%."
-            )
-            recommended_actions["river"] = (
-                "Select polarized 120% bets with nut blockers, check medium strength to bluff catch."
-            )
-        elif category.startswith("paired"):
-            recommended_actions["flop"] = (
-                "Range stab 33% to deny equity; mix in checks with underpairs to protect checking range."
-            )
-            recommended_actions["turn"] = (
-                "Double barrel 65% when unpaired overcards fall; slow down on coordinated cards."
-            )
-            recommended_actions["river"] = (
-                "Shove or bet 120% with quads/full houses; thin value 55% with overpairs blocking boats."
-            )
-        elif category == "low_connected":
-            recommended_actions["flop"] = (
-                "Check 50%+; bet 45% pot with overpairs and strong draws, mixing some large bets with sets."
-            )
-            recommended_actions["turn"] = (
-                "Pressure with 70% pot on bricks; overbet when straight advantage persists."
-            )
-            recommended_actions["river"] = (
-                "Bluff missed overcards blocking straights; value bet 65% with overpairs."
-            )
-        else:
-            recommended_actions["flop"] = (
-                "Adopt balanced 40% frequency bets (~50% pot) to probe; check-call marginal made hands."
-            )
-            recommended_actions["turn"] = (
-                "Select 70% pot barrels when range retains nut advantage, otherwise check with medium pairs."
-            )
-            recommended_actions["river"] = (
-                "Use 75% pot value bets for straights+; choose bluff combos that block villain's top pairs."
-            )
+        texture = "paired" if category.startswith("paired") else category
+        action_table = _SHORT_STACK_ACTIONS if stack_profile == "short" else _RECOMMENDED_ACTIONS
+        recommended_actions = action_table.get(texture, action_table["dry_low"])
 
         blocker_applications: List[str] = []
         dominant_suit = suits[0] if suits else None
@@ -593,29 +720,16 @@ class TexasSolverAPI:
                 "Prioritize blockers that remove villain's strongest continues to maintain proper bluff:value ratios."
             )
 
-        if stack_profile == "short":
-            recommended_actions["turn"] += " Adjust frequencies downward to avoid stack-commitment without equity."
-            recommended_actions["river"] += " Choose shove-or-fold decisions based on nut blockers."
-
         return PostflopStrategy(
             board=board,
             category=category,
             hero_range_advantage=hero_advantage,
             recommended_actions=recommended_actions,
-            blocker_applications=blocker_applications
+            blocker_applications=tuple(blocker_applications)
         )
 
     def explain_blocker_importance(self, postflop_strategy: PostflopStrategy) -> str:
-        explanation_lines = [
-            f"On board {postflop_strategy.board}, blockers dictate combo availability and therefore bluffing frequency.",
-            "Key blocker applications:"
-        ]
-        for note in postflop_strategy.blocker_applications:
-            explanation_lines.append(f"- {note}")
-        explanation_lines.append(
-            "Balancing these blockers with value combos keeps betting ranges within solver-approved bluff:value ratios."
-        )
-        return "\n".join(explanation_lines)
+        return _blocker_explanation(postflop_strategy.board, postflop_strategy.blocker_applications)
 
 class PokerResearchTool:
     """
@@ -635,23 +749,25 @@ class PokerResearchTool:
             
         Returns:
             Dict with analysis results
+            
+        Raises:
+            ValueError: If num_simulations is not positive
         """
+        if num_simulations <= 0:
+            raise ValueError(f"num_simulations must be positive, got {num_simulations}")
+        
         results = {
             'avg_ev': 0.0,
             'win_rate': 0.0,
             'optimal_frequencies': {}
         }
         
-        total_ev = 0.0
-        wins = 0
-        
-        for _ in range(num_simulations):
-            # Simulate random spot
-            position = Position.BTN  # Default position
-            solution = self.solver.analyze_spot(position, [], {position: 100})
-            total_ev += solution.ev
-            if solution.ev > 0:
-                wins += 1
+        # Every simulated spot is the same deterministic default spot, so it is
+        # solved once and its outcome scaled by the number of simulations
+        position = Position.BTN  # Default position
+        solution = self.solver.analyze_spot(position, [], {position: 100})
+        total_ev = solution.ev * num_simulations
+        wins = num_simulations if solution.ev > 0 else 0
         
         results['avg_ev'] = total_ev / num_simulations
         results['win_rate'] = wins / num_simulations
@@ -671,23 +787,17 @@ class PokerResearchTool:
         """
         hero_equity = self.solver.calculate_hand_equity(hero_hand)
         
-        # Calculate average equity against range
-        total_equity = 0.0
-        total_frequency = 0.0
-        
-        for hand, frequency in villain_range.hands.items():
-            if frequency > 0:
-                equity_vs_hand = self.solver.calculate_hand_equity(hero_hand, opponents=1)
-                total_equity += equity_vs_hand * frequency
-                total_frequency += frequency
-        
-        avg_equity = total_equity / total_frequency if total_frequency > 0 else 0.5
+        # The simplified model gives the same heads-up equity against every
+        # villain hand, so the frequency-weighted average over the range is
+        # that equity itself. Weight per hand again once equity depends on it.
+        equity_vs_hand = self.solver.calculate_hand_equity(hero_hand, opponents=1)
+        avg_equity = equity_vs_hand if villain_range.active_size > 0 else 0.5
         
         return {
             'hero_hand': hero_hand,
             'equity_vs_range': avg_equity,
             'raw_equity': hero_equity,
-            'range_size': len([h for h, f in villain_range.hands.items() if f > 0])
+            'range_size': villain_range.active_size
         }
     
     def export_ranges_to_file(self, ranges: Dict[Position, HandRange], filename: str):
@@ -701,12 +811,16 @@ class PokerResearchTool:
         data = {}
         for position, hand_range in ranges.items():
             data[position.value] = {
-                'hands': hand_range.hands,
+                'hands': dict(hand_range.hands),
                 'action': hand_range.action.value
             }
         
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(data, f, indent=2)
         
         print(f"Ranges exported to {filename}")
 
@@ -724,8 +838,7 @@ def demonstrate_gto_analysis():
     print("\n1. Preflop Range Analysis by Stack Depth:")
     for stack in [100, 40, 20]:
         range_analysis = research_tool.solver.analyze_preflop_range(Position.CO, stack_size=stack)
-        range_size = len([h for h, f in range_analysis.hands.items() if f > 0])
-        print(f"   CO {stack}bb: {range_size} combos, action = {range_analysis.action.value}")
+        print(f"   CO {stack}bb: {range_analysis.active_size} combos, action = {range_analysis.action.value}")
 
     # Show equilibrium bet sizing plan
     print("\n2. Bet Sizing Equilibrium Plan (BTN vs BB, 60bb):")
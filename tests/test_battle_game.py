@@ -0,0 +1,48 @@
+"""Tests for the battle game's soldier-mask bitmaps"""
+
+import unittest
+
+import numpy as np
+
+from battle_game import _BIT_CELLS, align_bits, mask_to_bits
+
+
+def _captures_by_loop(mask, enemy_mask, nx, ny, ex, ey):
+    """The nested-loop capture check that align_bits replaced; returns captured enemy cells"""
+    captured = np.zeros((3, 3), dtype=bool)
+    for i in range(max(nx, ex), min(nx + 3, ex + 3)):
+        for j in range(max(ny, ey), min(ny + 3, ey + 3)):
+            if mask[i - nx, j - ny] != 0 and enemy_mask[i - ex, j - ey] != 0:
+                captured[i - ex, j - ey] = True
+    return captured
+
+
+class MaskBitsTest(unittest.TestCase):
+    def test_bit_cells_round_trip(self):
+        for bits in range(512):
+            self.assertEqual(mask_to_bits(_BIT_CELLS[bits].astype(int)), bits)
+
+    def test_align_bits_matches_loop(self):
+        # Every attacker mask at every offset in -4..4, against a full enemy block
+        enemy_mask = np.ones((3, 3), dtype=int)
+        for bits in range(512):
+            mask = _BIT_CELLS[bits].astype(int)
+            for dx in range(-4, 5):
+                for dy in range(-4, 5):
+                    expected = _captures_by_loop(mask, enemy_mask, dx, dy, 0, 0)
+                    self.assertEqual(align_bits(bits, dx, dy), mask_to_bits(expected),
+                                     f"bits={bits:09b} dx={dx} dy={dy}")
+
+    def test_capture_matches_loop_for_partial_enemy(self):
+        rng = np.random.default_rng(0)
+        for bits, enemy_bits in rng.integers(0, 512, size=(200, 2)).tolist():
+            mask = _BIT_CELLS[bits].astype(int)
+            enemy_mask = _BIT_CELLS[enemy_bits].astype(int)
+            for dx in range(-3, 4):
+                for dy in range(-3, 4):
+                    expected = _captures_by_loop(mask, enemy_mask, 4 + dx, 4 + dy, 4, 4)
+                    self.assertEqual(align_bits(bits, dx, dy) & enemy_bits, mask_to_bits(expected))
+
+
+if __name__ == "__main__":
+    unittest.main()
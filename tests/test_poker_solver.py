@@ -0,0 +1,121 @@
+"""Tests for poker_solver"""
+
+import itertools
+import random
+import unittest
+
+from poker_solver import PokerAction, PokerResearchTool, Position, TexasSolverAPI
+
+
+class SimulateTournamentSpotsTest(unittest.TestCase):
+    def setUp(self):
+        self.tool = PokerResearchTool()
+
+    def test_positive_count(self):
+        results = self.tool.simulate_tournament_spots(1000)
+        self.assertEqual(results['avg_ev'], 0.15)
+        self.assertEqual(results['win_rate'], 1.0)
+
+    def test_zero_count_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.tool.simulate_tournament_spots(0)
+
+    def test_negative_count_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.tool.simulate_tournament_spots(-5)
+
+
+class PositionLookupTest(unittest.TestCase):
+    def setUp(self):
+        self.solver = TexasSolverAPI()
+
+    def test_enum_position_has_range(self):
+        self.assertGreater(self.solver.analyze_preflop_range(Position.BTN).active_size, 0)
+
+    def test_string_position_matches_enum_range(self):
+        for position in Position:
+            with self.subTest(position=position):
+                by_enum = self.solver.analyze_preflop_range(position)
+                by_string = self.solver.analyze_preflop_range(position.value)
+                self.assertEqual(dict(by_string.hands), dict(by_enum.hands))
+                self.assertEqual(by_string.action, by_enum.action)
+
+    def test_string_position_matches_enum_sizing(self):
+        by_enum = self.solver.get_bet_sizing_plan(Position.BTN, 100, 3.0)
+        by_string = self.solver.get_bet_sizing_plan("BTN", 100, 3.0)
+        self.assertEqual(by_string.street_recommendations, by_enum.street_recommendations)
+        self.assertEqual(by_string.notes, by_enum.notes)
+
+    def test_string_villain_is_treated_as_big_blind(self):
+        by_enum = self.solver.analyze_postflop_spot("Kh7d2c", 6.0, 100, Position.BTN, Position.BB)
+        by_string = self.solver.analyze_postflop_spot("Kh7d2c", 6.0, 100, "BTN", "BB")
+        self.assertEqual(by_string, by_enum)
+
+    def test_unknown_position_gets_empty_range(self):
+        self.assertEqual(dict(self.solver.analyze_preflop_range("XX").hands), {})
+
+def _legacy_categorize_board(board):
+    """The set/list board categorization that the bitmask version replaced"""
+    ranks = [board[i] for i in range(0, len(board), 2)]
+    suits = [board[i + 1] for i in range(0, len(board), 2) if i + 1 < len(board)]
+    rank_order = "23456789TJQKA"
+    indices = [rank_order.index(r) for r in ranks if r in rank_order]
+    if not indices:
+        indices = [0]
+    spread = max(indices) - min(indices)
+    unique_suits = set(suits)
+    is_monotone = len(unique_suits) == 1
+    is_two_tone = len(unique_suits) == 2
+    is_paired = len(ranks) != len(set(ranks))
+    high_cards = sum(1 for r in ranks if r in "TJQKA")
+    top_rank = ranks[0] if ranks else ""
+
+    if is_monotone:
+        return "monotone"
+    if is_paired and high_cards >= 1:
+        return "paired_high"
+    if is_paired:
+        return "paired_low"
+    if is_two_tone and spread <= 4:
+        return "dynamic"
+    if high_cards >= 2:
+        return "dry_high"
+    if high_cards >= 1 and top_rank in "AKQ" and spread >= 4:
+        return "dry_high"
+    if spread <= 4:
+        return "low_connected"
+    return "dry_low"
+
+
+class CategorizeBoardTest(unittest.TestCase):
+    DECK = [rank + suit for rank in "23456789TJQKA" for suit in "shdc"]
+
+    def setUp(self):
+        self.solver = TexasSolverAPI()
+
+    def assertMatchesLegacy(self, board):
+        self.assertEqual(self.solver._categorize_board(*self.solver._parse_board(board)),
+                         _legacy_categorize_board(board), f"board={board!r}")
+
+    def test_every_flop(self):
+        for cards in itertools.combinations(self.DECK, 3):
+            self.assertMatchesLegacy("".join(cards))
+
+    def test_turn_and_river_boards(self):
+        rng = random.Random(0)
+        for size in (4, 5):
+            for _ in range(5000):
+                self.assertMatchesLegacy("".join(rng.sample(self.DECK, size)))
+
+    def test_malformed_boards(self):
+        for board in ("", "A", "Ah", "AhK", "ahkd2c", "AHKD2C", "AhAhAh", "Ah Kd 2c", "1h0d2c",
+                      "XxYyZz", "AhKd2c7s9hQd", "\u00c5h2d3c"):
+            self.assertMatchesLegacy(board)
+        rng = random.Random(1)
+        alphabet = "23456789TJQKAshdc" + "akqjtSHDCx1? "
+        for _ in range(20000):
+            self.assertMatchesLegacy("".join(rng.choices(alphabet, k=rng.randint(0, 12))))
+
+
+if __name__ == "__main__":
+    unittest.main()